@@ -19,6 +19,7 @@ __all__ = [
     "encode_to_bytes",
     # Decoder
     "decode_from_bytes",
+    "decode_to_columns",
     "JONXFile",
     #Type
     "detect_type",
@@ -3,10 +3,12 @@ Interface en ligne de commande (CLI) pour jsonplusplus.
 """
 
 import argparse
-import json
 import sys
 import os
+import orjson
+import numpy as np
 from pathlib import Path
+from .utils.compression import get_decompressor
 from . import (
     jonx_encode,
     encode_to_bytes,
@@ -58,6 +60,13 @@ def cmd_encode(args):
         sys.exit(1)
 
 
+def _json_default(obj):
+    """Sérialise les valeurs non gérées nativement par orjson."""
+    if isinstance(obj, np.ndarray):
+        return obj.tolist()
+    return str(obj)
+
+
 def cmd_decode(args):
     """Commande pour décoder JONX → JSON"""
     try:
@@ -78,11 +87,31 @@ def cmd_decode(args):
         with open(args.input, "rb") as f:
             jonx_bytes = f.read()
         
-        result = decode_from_bytes(jonx_bytes)
-        
-        # Écrire le JSON
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(result["json_data"], f, indent=2, ensure_ascii=False)
+        if args.columns:
+            # Sortie colonnée : les tableaux numpy sont sérialisés en C par
+            # orjson, sans reconstruire les lignes
+            result = decode_from_bytes(jonx_bytes, rows=False)
+            payload = {
+                "fields": result["fields"],
+                "types": result["types"],
+                "columns": result["columns"],
+            }
+            with open(output_path, 'wb') as f:
+                f.write(orjson.dumps(
+                    payload,
+                    default=_json_default,
+                    option=orjson.OPT_SERIALIZE_NUMPY
+                ))
+        else:
+            result = decode_from_bytes(jonx_bytes)
+
+            # Écrire le JSON (orjson : sérialisation en C, UTF-8 natif)
+            with open(output_path, 'wb') as f:
+                f.write(orjson.dumps(
+                    result["json_data"],
+                    default=_json_default,
+                    option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY
+                ))
         
         print(f"✅ Décodage réussi!")
         print(f"   Version: {result['version']}")
@@ -223,6 +252,48 @@ def cmd_query(args):
         sys.exit(1)
 
 
+def cmd_export(args):
+    """Commande pour extraire les octets bruts d'une colonne (sans JSON)"""
+    try:
+        if not os.path.exists(args.file):
+            print(f"❌ Erreur: Le fichier '{args.file}' n'existe pas", file=sys.stderr)
+            sys.exit(1)
+        
+        with JONXFile(args.file) as jonx_file:
+            if args.column not in jonx_file.fields:
+                print(f"❌ Erreur: La colonne '{args.column}' n'existe pas", file=sys.stderr)
+                print(f"Colonnes disponibles: {', '.join(jonx_file.fields)}", file=sys.stderr)
+                sys.exit(1)
+            
+            frame = jonx_file.compressed_columns[args.column]
+            
+            # Décompression en flux de la trame (vue sur le mmap) vers la
+            # sortie : ni liste Python, ni re-sérialisation JSON
+            if args.output:
+                out = open(args.output, "wb")
+            else:
+                out = sys.stdout.buffer
+            try:
+                with get_decompressor().stream_writer(out, closefd=False) as writer:
+                    writer.write(frame)
+            finally:
+                if args.output:
+                    out.close()
+                else:
+                    out.flush()
+            
+            if args.output:
+                print(f"✅ Colonne '{args.column}' ({jonx_file.types[args.column]}) "
+                      f"exportée vers {args.output}")
+        
+    except JONXError as e:
+        print(f"❌ Erreur JONX: {e}", file=sys.stderr)
+        sys.exit(1)
+    except Exception as e:
+        print(f"❌ Erreur: {e}", file=sys.stderr)
+        sys.exit(1)
+
+
 def cmd_view(args):
     """Commande pour ouvrir le visualiseur GUI"""
     try:
@@ -267,6 +338,9 @@ Exemples:
   jsonplusplus query data.jonx price --min
   jsonplusplus query data.jonx age --avg
   
+  # Extraire une colonne brute (ex: int32 little-endian pour numpy)
+  jsonplusplus export data.jonx price -o price.bin
+  
   # Ouvrir le visualiseur GUI
   jsonplusplus view
   jsonplusplus view data.jonx
@@ -285,6 +359,8 @@ Exemples:
     decode_parser = subparsers.add_parser("decode", help="Décoder JONX → JSON")
     decode_parser.add_argument("input", help="Fichier JONX d'entrée")
     decode_parser.add_argument("-o", "--output", help="Fichier JSON de sortie (optionnel)")
+    decode_parser.add_argument("--columns", action="store_true",
+                              help="Écrire un JSON colonné {fields, types, columns} (plus rapide)")
     decode_parser.set_defaults(func=cmd_decode)
     
     # Commande info
@@ -315,6 +391,16 @@ Exemples:
                              help="Utiliser l'index pour les opérations min/max")
     query_parser.set_defaults(func=cmd_query)
     
+    # Commande export
+    export_parser = subparsers.add_parser(
+        "export", help="Extraire les octets bruts décompressés d'une colonne"
+    )
+    export_parser.add_argument("file", help="Fichier JONX")
+    export_parser.add_argument("column", help="Nom de la colonne")
+    export_parser.add_argument("-o", "--output",
+                              help="Fichier de sortie (optionnel, sortie standard si omis)")
+    export_parser.set_defaults(func=cmd_export)
+    
     # Commande view
     view_parser = subparsers.add_parser("view", help="Ouvrir le visualiseur GUI")
     view_parser.add_argument("file", nargs="?", help="Fichier JONX à ouvrir (optionnel)")
@@ -1,9 +1,15 @@
-import orjson
 import zstandard as zstd
-import struct
 import numpy as np
+import mmap
 import os
-from .utils.decoder import decode_from_bytes
+import traceback
+from collections import OrderedDict
+from .utils.compression import decompress_many, get_decompressor
+from .utils.decoder import (
+    read_layout, decode_column, decode_index, decode_value, NUMPY_DTYPES,
+    _parse_nullable_type
+)
+from .utils.packing import dictionary_code_dtype
 
 
 from .exceptions import (
@@ -28,6 +34,39 @@ SUPPORTED_TYPES = NUMERIC_TYPES | {
 }
 
 
+# Budget mémoire (en octets décompressés) du cache de colonnes d'un JONXFile
+COLUMN_CACHE_MAX_BYTES = 512 << 20
+
+# En dessous de ce nombre de lignes, find_min/find_max calculent directement
+# l'extremum sur le tableau numpy plutôt que de décompresser l'index
+INDEX_LOOKUP_MIN_ROWS = 1 << 20
+
+
+def _to_python(value):
+    """Convertit un scalaire numpy en valeur Python native."""
+    if isinstance(value, np.generic):
+        return value.item()
+    return value
+
+
+def _column_sum(column):
+    """
+    Somme d'une colonne, calculée par numpy quand c'est possible.
+
+    Les entiers jusqu'à 32 bits sont accumulés en int64 (exact) ; les
+    entiers 64 bits repassent par la somme Python pour ne pas déborder.
+    Les flottants sont accumulés en float64.
+    """
+    if isinstance(column, np.ndarray):
+        kind = column.dtype.kind
+        if kind in "iu" and column.dtype.itemsize < 8:
+            return int(column.sum(dtype=np.int64))
+        if kind == "f":
+            return column.sum(dtype=np.float64).item()
+        column = column.tolist()
+    return sum(column)
+
+
 class JONXFile:
     def __init__(self, path):
         """
@@ -64,71 +103,138 @@ class JONXFile:
                 {"path": path}
             )
         
+        self._init_state(path)
+        self._load_file()
+
+    @classmethod
+    def from_bytes(cls, data):
+        """
+        Construit un JONXFile à partir de données JONX déjà en mémoire,
+        sans passer par le système de fichiers.
+
+        Args:
+            data: Données JONX (bytes, bytearray, memoryview ou mmap)
+
+        Returns:
+            JONXFile: Instance prête à être interrogée (path vaut None)
+
+        Raises:
+            JONXDecodeError: Si les données sont corrompues
+            JONXValidationError: Si les données sont invalides
+        """
+        if not isinstance(data, (bytes, bytearray, memoryview, mmap.mmap)):
+            raise JONXValidationError(
+                "Les données doivent être de type bytes",
+                {"type": type(data).__name__}
+            )
+        jonx_file = cls.__new__(cls)
+        jonx_file._init_state(None)
+        jonx_file._parse(memoryview(data))
+        return jonx_file
+
+    def _init_state(self, path):
         self.path = path
+        self.version = None
         self.fields = []
         self.types = {}
+        self.schema = {}
+        self.stats = {}
         self.compressed_columns = {}
         self.indexes = {}
-        self._load_file()
+        # Type de base (sans nullable<>) de chaque champ, calculé au chargement
+        self._base_types = {}
+        self._column_offsets = {}
+        # Nombre de lignes (schéma v6+, sinon calculé au premier count())
+        self._num_rows = None
+        # Colonnes déjà décompressées (LRU borné à COLUMN_CACHE_MAX_BYTES)
+        # et index déjà décodés, par nom de champ
+        self._column_cache = OrderedDict()
+        self._column_cache_bytes = 0
+        self._index_cache = {}
+        self._size = 0
+        self._mmap = None
+
+    def close(self):
+        """
+        Libère la projection mémoire du fichier.
+
+        Les colonnes déjà décompressées restent utilisables ; les données
+        compressées ne sont plus accessibles après la fermeture.
+        """
+        self.compressed_columns = {}
+        self.indexes = {}
+        if self._mmap is not None:
+            try:
+                self._mmap.close()
+            except BufferError:
+                # Des vues sont encore référencées ailleurs : le GC s'en chargera
+                pass
+            self._mmap = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
 
     def _load_file(self):
+        # Le fichier est projeté en mémoire : les colonnes et index sont des
+        # vues sans copie, seules les pages réellement lues sont chargées.
         try:
             with open(self.path, "rb") as f:
-                data = f.read()
-        except IOError as e:
+                if os.fstat(f.fileno()).st_size == 0:
+                    raise JONXFileError(
+                        f"Le fichier est vide: {self.path}",
+                        {"path": self.path}
+                    )
+                self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (IOError, ValueError) as e:
             raise JONXFileError(
                 f"Impossible de lire le fichier: {self.path}",
                 {"path": self.path, "error": str(e)}
             ) from e
-        
-        if len(data) == 0:
-            raise JONXFileError(
-                f"Le fichier est vide: {self.path}",
-                {"path": self.path}
-            )
 
+        view = memoryview(self._mmap)
         try:
-            result = decode_from_bytes(data)
-            self.fields = result["fields"]
-            self.types = result["types"]
-        except (JONXDecodeError, JONXValidationError) as e:
-            # Ajouter le chemin du fichier aux détails
-            if hasattr(e, 'details'):
+            self._parse(view)
+        except BaseException as e:
+            # En-tête ou schéma illisible : libérer la projection et le
+            # descripteur tout de suite plutôt qu'au passage du GC. Les
+            # variables locales des frames de la trace (read_layout...)
+            # tiennent encore des vues sur la projection et empêcheraient
+            # sa fermeture : on les efface d'abord.
+            traceback.clear_frames(e.__traceback__)
+            try:
+                view.release()
+            except BufferError:
+                pass
+            self.close()
+            if isinstance(e, (JONXDecodeError, JONXValidationError)) and hasattr(e, 'details'):
+                # Ajouter le chemin du fichier aux détails
                 e.details['file_path'] = self.path
             raise
 
-        if not data.startswith(b"JONX"):
-            raise JONXDecodeError(
-                f"Le fichier n'est pas au format JONX: {self.path}",
-                {"path": self.path}
-            )
-
-        offset = 8
-
-        schema_size = struct.unpack("I", data[offset:offset + 4])[0]
-        offset += 4 + schema_size
+    def _parse(self, data):
+        """
+        Lit le schéma et repère les colonnes et index compressés (vues sans
+        copie sur data), en un seul parcours et sans rien décompresser
+        d'autre que le schéma.
 
-        # --- Colonnes compressées ---
-        for field in self.fields:
-            col_size = struct.unpack("I", data[offset:offset + 4])[0]
-            offset += 4
-            self.compressed_columns[field] = data[offset:offset + col_size]
-            offset += col_size
-
-        # --- Index compressés ---
-        num_indexes = struct.unpack("I", data[offset:offset + 4])[0]
-        offset += 4
-
-        for _ in range(num_indexes):
-            name_len = struct.unpack("I", data[offset:offset + 4])[0]
-            offset += 4
-            name = data[offset:offset + name_len].decode()
-            offset += name_len
-
-            idx_size = struct.unpack("I", data[offset:offset + 4])[0]
-            offset += 4
-            self.indexes[name] = data[offset:offset + idx_size]
-            offset += idx_size
+        Args:
+            data: memoryview sur les données JONX
+        """
+        layout = read_layout(data)
+        self.version = layout["version"]
+        self.fields = layout["fields"]
+        self.types = layout["types"]
+        self.schema = layout["schema"]
+        self.stats = self.schema.get("stats", {})
+        self.compressed_columns = layout["columns"]
+        self._column_offsets = layout["column_offsets"]
+        self.indexes = layout["indexes"]
+        self._base_types = {f: _parse_nullable_type(self.types[f])[1] for f in self.fields}
+        self._num_rows = self.schema.get("num_rows")
+        self._size = len(data)
 
     def _validate_field_name(self, field_name):
         """
@@ -146,7 +252,7 @@ class JONXFile:
                 {"type": type(field_name).__name__}
             )
         
-        if field_name not in self.fields:
+        if field_name not in self._base_types:
             raise JONXValidationError(
                 f"La colonne '{field_name}' n'existe pas",
                 {
@@ -166,83 +272,61 @@ class JONXFile:
             JONXValidationError: Si la colonne n'existe pas ou n'est pas numérique
         """
         self._validate_field_name(field_name)
-        col_type = self.types.get(field_name)
-
-        # Gérer les types nullable
-        base_type = col_type
-        if isinstance(col_type, str) and col_type.startswith("nullable<") and col_type.endswith(">"):
-            base_type = col_type[9:-1]
 
-        if base_type not in NUMERIC_TYPES:
+        if self._base_types[field_name] not in NUMERIC_TYPES:
             raise JONXValidationError(
                 f"La colonne '{field_name}' n'est pas numérique",
-                {"field": field_name, "type": col_type}
+                {"field": field_name, "type": self.types.get(field_name)}
             )
 
-    def _decompress_column(self, field_name, compressed):
+    def _decompress_packed(self, field_name):
         try:
-            packed = zstd.ZstdDecompressor().decompress(compressed)
+            return get_decompressor().decompress(self.compressed_columns[field_name])
         except zstd.ZstdError as e:
             raise JONXDecodeError(
                 f"Erreur lors de la décompression de la colonne '{field_name}'",
                 {"field": field_name, "error": str(e)}
             ) from e
 
-        t = self.types[field_name]
-
-        # Mapping des types numériques vers leurs formats struct
-        numeric_formats = {
-            "int8": ("b", 1),
-            "int16": ("h", 2),
-            "int32": ("i", 4),
-            "int64": ("q", 8),
-            "uint8": ("B", 1),
-            "uint16": ("H", 2),
-            "uint32": ("I", 4),
-            "uint64": ("Q", 8),
-            "float32": ("f", 4),
-            "float64": ("d", 8),
-        }
-
-        try:
-            # Types numériques standards
-            if t in numeric_formats:
-                fmt, size = numeric_formats[t]
-                n = len(packed) // size
-                return list(struct.unpack(f"{n}{fmt}", packed))
-
-            # float16 nécessite numpy
-            if t == "float16":
-                arr = np.frombuffer(packed, dtype=np.float16)
-                return arr.astype(np.float32).tolist()
-
-            # bool
-            if t == "bool":
-                return [bool(b) for b in packed]
-
-            # Tous les autres types (str, json, uuid, date, datetime, enum, string_dict, binary, etc.)
-            return orjson.loads(packed)
-        except (struct.error, orjson.JSONDecodeError) as e:
-            raise JONXDecodeError(
-                f"Erreur lors du décodage de la colonne '{field_name}'",
-                {"field": field_name, "type": t, "error": str(e)}
-            ) from e
+    def _decompress_column(self, field_name):
+        packed = self._decompress_packed(field_name)
+        # Même décodage par type que decode_from_bytes
+        return decode_column(packed, self.types[field_name], field_name, self.schema)
 
     def get_column(self, field_name):
         """
         Récupère une colonne décompressée avec validation.
         
+        La colonne n'est décompressée qu'au premier appel, puis conservée
+        en cache sur l'instance (LRU borné à COLUMN_CACHE_MAX_BYTES octets
+        décompressés). Le cache est partagé entre les appelants et ne peut
+        pas être modifié à travers le résultat : les tableaux numpy sont en
+        lecture seule, les autres colonnes sont des tuples (les objets d'une
+        colonne json restent partagés).
+        
         Args:
             field_name: Nom de la colonne
             
         Returns:
-            list: Liste des valeurs de la colonne
+            np.ndarray | tuple: Tableau numpy (lecture seule) pour les colonnes
+            numériques et booléennes, tuple des valeurs pour les autres types
             
         Raises:
             JONXValidationError: Si la colonne n'existe pas
             JONXDecodeError: Si la décompression échoue
         """
         self._validate_field_name(field_name)
+        return self._column(field_name)
+
+    def _column(self, field_name):
+        """
+        Retourne la colonne en cache (décompressée au besoin), sans
+        validation du nom : réservé aux méthodes qui l'ont déjà validé.
+        """
+        cached = self._column_cache.get(field_name)
+        if cached is not None:
+            self._column_cache.move_to_end(field_name)
+            return cached[0]
         
         if field_name not in self.compressed_columns:
             raise JONXDecodeError(
@@ -250,7 +334,75 @@ class JONXFile:
                 {"field": field_name, "available_columns": list(self.compressed_columns.keys())}
             )
         
-        return self._decompress_column(field_name, self.compressed_columns[field_name])
+        return self._cache_column(field_name, self._decompress_column(field_name))
+
+    def _cache_column(self, field_name, column):
+        """
+        Ajoute une colonne décodée au cache LRU et évince les plus anciennes
+        tant que le budget COLUMN_CACHE_MAX_BYTES est dépassé.
+        
+        Les tableaux numpy sont passés en lecture seule et les listes
+        converties une fois en tuples : la colonne en cache est partagée par
+        tous les appelants sans copie.
+        
+        Returns:
+            np.ndarray | tuple: La colonne telle que mise en cache
+        """
+        compressed = self.compressed_columns[field_name]
+        
+        # Taille décompressée lue dans l'en-tête de la trame zstd
+        nbytes = zstd.frame_content_size(compressed)
+        if nbytes < 0:
+            nbytes = len(compressed)
+        if isinstance(column, np.ndarray):
+            column.flags.writeable = False
+        else:
+            column = tuple(column)
+        self._column_cache[field_name] = (column, nbytes)
+        self._column_cache_bytes += nbytes
+        
+        # Évincer les colonnes les moins récemment utilisées
+        while self._column_cache_bytes > COLUMN_CACHE_MAX_BYTES and len(self._column_cache) > 1:
+            _, (_, evicted) = self._column_cache.popitem(last=False)
+            self._column_cache_bytes -= evicted
+        return column
+
+    def _get_index(self, field):
+        """
+        Retourne l'index trié décodé d'une colonne (mis en cache).
+        
+        Raises:
+            zstd.ZstdError, ValueError: Si l'index est corrompu
+        """
+        idx = self._index_cache.get(field)
+        if idx is None:
+            idx = decode_index(get_decompressor().decompress(self.indexes[field]), self.version)
+            self._index_cache[field] = idx
+        return idx
+
+    def _index_lookup(self, field, position):
+        """
+        Retourne la valeur de la ligne placée à la position donnée de l'index
+        trié (0 = minimum, -1 = maximum) en ne décodant que cette ligne.
+        
+        Raises:
+            JONXIndexError: Si l'index est vide ou illisible
+            JONXDecodeError: Si la colonne est corrompue
+        """
+        try:
+            idx = self._get_index(field)
+        except (zstd.ZstdError, ValueError) as e:
+            raise JONXIndexError(
+                f"Erreur lors de la lecture de l'index pour '{field}'",
+                {"field": field, "error": str(e)}
+            ) from e
+        if len(idx) == 0:
+            raise JONXIndexError(
+                f"L'index pour la colonne '{field}' est vide",
+                {"field": field}
+            )
+        packed = self._decompress_packed(field)
+        return decode_value(packed, self.types[field], field, self.schema, int(idx[position]))
 
     def find_min(self, field, column=None, use_index=False):
         """
@@ -270,8 +422,21 @@ class JONXFile:
         """
         self._validate_field_name(field)
         
+        # Min/max précalculés à l'encodage (clé "stats" du schéma) : aucune décompression
+        if use_index and column is None and field in self.stats:
+            return self.stats[field]["min"]
+        
+        # Colonne pas encore chargée : seule la ligne désignée par l'index est
+        # décodée, sauf pour une colonne numérique de taille modeste (réduction
+        # numpy ci-dessous, moins coûteuse que la décompression de l'index)
+        if (use_index and column is None and field in self.indexes
+                and field not in self._column_cache
+                and (self.types[field] not in NUMPY_DTYPES
+                     or self._row_count() >= INDEX_LOOKUP_MIN_ROWS)):
+            return self._index_lookup(field, 0)
+        
         if column is None:
-            column = self.get_column(field)
+            column = self._column(field)
         
         if len(column) == 0:
             raise JONXValidationError(
@@ -285,20 +450,27 @@ class JONXFile:
                     f"L'index pour la colonne '{field}' n'existe pas",
                     {"field": field, "available_indexes": list(self.indexes.keys())}
                 )
+            # Colonne numérique de taille modeste : le min vectorisé coûte
+            # moins cher que la décompression de l'index (NaN ignorés, comme
+            # dans l'index trié où ils sont rangés en dernier)
+            if isinstance(column, np.ndarray) and len(column) < INDEX_LOOKUP_MIN_ROWS:
+                return np.fmin.reduce(column).item()
             try:
-                idx = orjson.loads(zstd.ZstdDecompressor().decompress(self.indexes[field]))
+                idx = self._get_index(field)
                 if len(idx) == 0:
                     raise JONXIndexError(
                         f"L'index pour la colonne '{field}' est vide",
                         {"field": field}
                     )
-                return column[idx[0]]
-            except (zstd.ZstdError, orjson.JSONDecodeError) as e:
+                return _to_python(column[idx[0]])
+            except (zstd.ZstdError, ValueError) as e:
                 raise JONXIndexError(
                     f"Erreur lors de la lecture de l'index pour '{field}'",
                     {"field": field, "error": str(e)}
                 ) from e
         
+        if isinstance(column, np.ndarray):
+            return column.min().item()
         return min(column)
 
     def find_max(self, field, column=None, use_index=False):
@@ -319,8 +491,21 @@ class JONXFile:
         """
         self._validate_field_name(field)
         
+        # Min/max précalculés à l'encodage (clé "stats" du schéma) : aucune décompression
+        if use_index and column is None and field in self.stats:
+            return self.stats[field]["max"]
+        
+        # Colonne pas encore chargée : seule la ligne désignée par l'index est
+        # décodée, sauf pour une colonne numérique de taille modeste (réduction
+        # numpy ci-dessous, moins coûteuse que la décompression de l'index)
+        if (use_index and column is None and field in self.indexes
+                and field not in self._column_cache
+                and (self.types[field] not in NUMPY_DTYPES
+                     or self._row_count() >= INDEX_LOOKUP_MIN_ROWS)):
+            return self._index_lookup(field, -1)
+        
         if column is None:
-            column = self.get_column(field)
+            column = self._column(field)
         
         if len(column) == 0:
             raise JONXValidationError(
@@ -334,20 +519,27 @@ class JONXFile:
                     f"L'index pour la colonne '{field}' n'existe pas",
                     {"field": field, "available_indexes": list(self.indexes.keys())}
                 )
+            # Colonne numérique de taille modeste : le max vectorisé coûte
+            # moins cher que la décompression de l'index (un NaN l'emporte,
+            # comme dans l'index trié où il est rangé en dernier)
+            if isinstance(column, np.ndarray) and len(column) < INDEX_LOOKUP_MIN_ROWS:
+                return column.max().item()
             try:
-                idx = orjson.loads(zstd.ZstdDecompressor().decompress(self.indexes[field]))
+                idx = self._get_index(field)
                 if len(idx) == 0:
                     raise JONXIndexError(
                         f"L'index pour la colonne '{field}' est vide",
                         {"field": field}
                     )
-                return column[idx[-1]]  # Dernier élément de l'index trié = maximum
-            except (zstd.ZstdError, orjson.JSONDecodeError) as e:
+                return _to_python(column[idx[-1]])  # Dernier élément de l'index trié = maximum
+            except (zstd.ZstdError, ValueError) as e:
                 raise JONXIndexError(
                     f"Erreur lors de la lecture de l'index pour '{field}'",
                     {"field": field, "error": str(e)}
                 ) from e
         
+        if isinstance(column, np.ndarray):
+            return column.max().item()
         return max(column)
 
     def sum(self, field, column=None):
@@ -367,7 +559,7 @@ class JONXFile:
         self._validate_numeric_field(field)
         
         if column is None:
-            column = self.get_column(field)
+            column = self._column(field)
         
         if len(column) == 0:
             raise JONXValidationError(
@@ -375,7 +567,7 @@ class JONXFile:
                 {"field": field}
             )
         
-        return sum(column)
+        return _column_sum(column)
 
     def avg(self, field, column=None):
         """
@@ -394,7 +586,7 @@ class JONXFile:
         self._validate_numeric_field(field)
         
         if column is None:
-            column = self.get_column(field)
+            column = self._column(field)
         
         if len(column) == 0:
             raise JONXValidationError(
@@ -402,7 +594,7 @@ class JONXFile:
                 {"field": field}
             )
         
-        return sum(column) / len(column)
+        return _column_sum(column) / len(column)
 
     def count(self, field=None):
         """
@@ -421,10 +613,32 @@ class JONXFile:
             # Retourne le nombre total de lignes
             if len(self.fields) == 0:
                 return 0
-            return len(self.get_column(self.fields[0]))
+            return self._row_count()
         
         self._validate_field_name(field)
-        return len(self.get_column(field))
+        cached = self._column_cache.get(field)
+        if cached is not None:
+            return len(cached[0])
+        # Toutes les colonnes ont le même nombre de lignes (vérifié par check_schema)
+        return self._row_count()
+
+    def _row_count(self):
+        """
+        Nombre de lignes, sans décompression quand c'est possible : lu dans
+        le schéma (v6+), sinon déduit de la taille décompressée (en-tête de
+        trame zstd) d'une colonne numérique, sinon longueur de la première
+        colonne.
+        """
+        if self._num_rows is None:
+            for field in self.fields:
+                dtype = NUMPY_DTYPES.get(self.types[field])
+                size = zstd.frame_content_size(self.compressed_columns[field]) if dtype is not None else -1
+                if size >= 0:
+                    self._num_rows = size // dtype.itemsize
+                    break
+            else:
+                self._num_rows = len(self._column(self.fields[0]))
+        return self._num_rows
 
     def get_columns(self, field_names):
         """
@@ -455,8 +669,56 @@ class JONXFile:
         for field in field_names:
             self._validate_field_name(field)
         
+        self._prefetch_columns(field_names)
         return {field: self.get_column(field) for field in field_names}
 
+    def _advise_willneed(self, field_names):
+        """
+        Signale au noyau (madvise MADV_WILLNEED) les pages des trames qui
+        vont être lues, pour que la lecture disque démarre en arrière-plan
+        au lieu de défauts de page successifs pendant la décompression.
+        Sans effet hors mmap ou sur les plateformes sans madvise.
+        """
+        if self._mmap is None or not hasattr(mmap, "MADV_WILLNEED"):
+            return
+        for field in field_names:
+            start = self._column_offsets[field]
+            end = start + len(self.compressed_columns[field])
+            # madvise exige un début aligné sur une page
+            start -= start % mmap.PAGESIZE
+            try:
+                self._mmap.madvise(mmap.MADV_WILLNEED, start, end - start)
+            except OSError:
+                return
+
+    def _prefetch_columns(self, field_names):
+        """
+        Décompresse d'un coup (en parallèle si volumineux) les colonnes
+        absentes du cache et les y place.
+        
+        Les erreurs sont ignorées : get_column les signalera ensuite, colonne
+        par colonne, avec un message précis.
+        """
+        missing = [
+            field for field in dict.fromkeys(field_names)
+            if field not in self._column_cache and field in self.compressed_columns
+        ]
+        if len(missing) < 2:
+            return
+        
+        self._advise_willneed(missing)
+        try:
+            packed_list = decompress_many([self.compressed_columns[f] for f in missing])
+        except zstd.ZstdError:
+            return
+        
+        for field, packed in zip(missing, packed_list):
+            try:
+                column = decode_column(packed, self.types[field], field, self.schema)
+            except JONXDecodeError:
+                continue
+            self._cache_column(field, column)
+
     # ============================================================================
     # MÉTHODES UTILITAIRES
     # ============================================================================
@@ -476,20 +738,15 @@ class JONXFile:
                 - indexes: Liste des colonnes avec index
                 - file_size: Taille du fichier en bytes
         """
-        try:
-            file_size = os.path.getsize(self.path)
-        except OSError:
-            file_size = None
-        
         return {
             "path": self.path,
-            "version": 1,  # Version actuelle du format
+            "version": self.version,
             "num_rows": self.count() if len(self.fields) > 0 else 0,
             "num_columns": len(self.fields),
             "fields": self.fields.copy(),
             "types": self.types.copy(),
             "indexes": list(self.indexes.keys()),
-            "file_size": file_size
+            "file_size": self._size
         }
 
     def has_index(self, field):
@@ -522,14 +779,25 @@ class JONXFile:
             JONXValidationError: Si la colonne n'existe pas
         """
         self._validate_field_name(field)
-        col_type = self.types.get(field)
-
-        # Gérer les types nullable
-        base_type = col_type
-        if isinstance(col_type, str) and col_type.startswith("nullable<") and col_type.endswith(">"):
-            base_type = col_type[9:-1]
+        return self._base_types[field] in NUMERIC_TYPES
 
-        return base_type in NUMERIC_TYPES
+    def _expected_frame_size(self, field, num_rows):
+        """
+        Taille décompressée attendue de la colonne pour num_rows lignes, ou
+        None si le type n'a pas une largeur fixe (JSON, nullable...).
+        """
+        col_type = self.types[field]
+        dtype = NUMPY_DTYPES.get(col_type)
+        if dtype is not None:
+            return num_rows * dtype.itemsize
+        if col_type == "bool":
+            # Bitpacké à partir de la v6 (num_rows dans le schéma)
+            return (num_rows + 7) // 8 if "num_rows" in self.schema else num_rows
+        if col_type in ("enum", "string_dict"):
+            key = "enum_mappings" if col_type == "enum" else "string_dicts"
+            mapping = self.schema.get(key, {}).get(field, {})
+            return num_rows * dictionary_code_dtype(len(mapping)).itemsize
+        return None
 
     def check_schema(self):
         """
@@ -569,14 +837,28 @@ class JONXFile:
             if field not in self.compressed_columns:
                 errors.append(f"La colonne '{field}' n'a pas de données compressées")
         
-        # Vérifier la cohérence des longueurs (si possible sans décompression)
+        # Vérifier la cohérence des longueurs (si possible sans décompression :
+        # les colonnes à largeur fixe sont contrôlées via l'en-tête de leur trame)
         if len(self.fields) > 0:
             try:
-                first_col = self.get_column(self.fields[0])
-                expected_length = len(first_col)
+                expected_length = self._row_count()
+                
+                to_decode = []
+                for field in self.fields:
+                    expected_size = self._expected_frame_size(field, expected_length)
+                    size = zstd.frame_content_size(self.compressed_columns[field])
+                    if expected_size is None or size < 0:
+                        to_decode.append(field)
+                    elif size != expected_size:
+                        errors.append(
+                            f"La colonne '{field}' a une longueur incohérente "
+                            f"(attendu: {expected_length} lignes soit {expected_size} octets, "
+                            f"obtenu: {size} octets)"
+                        )
                 
-                for field in self.fields[1:]:
-                    col = self.get_column(field)
+                self._prefetch_columns(to_decode)
+                for field in to_decode:
+                    col = self._column(field)
                     if len(col) != expected_length:
                         errors.append(
                             f"La colonne '{field}' a une longueur incohérente "
@@ -620,7 +902,8 @@ class JONXFile:
         warnings.extend(schema_check["warnings"])
         
         # 2. Vérifier que le fichier existe et est lisible
-        if not os.path.exists(self.path):
+        # (sauf pour une instance construite en mémoire via from_bytes)
+        if self.path is not None and not os.path.exists(self.path):
             errors.append(f"Le fichier n'existe pas: {self.path}")
             return {
                 "valid": False,
@@ -628,7 +911,7 @@ class JONXFile:
                 "warnings": warnings
             }
         
-        if not os.access(self.path, os.R_OK):
+        if self.path is not None and not os.access(self.path, os.R_OK):
             errors.append(f"Permission de lecture refusée: {self.path}")
             return {
                 "valid": False,
@@ -637,9 +920,10 @@ class JONXFile:
             }
         
         # 3. Vérifier que toutes les colonnes peuvent être décompressées
+        self._prefetch_columns(self.fields)
         for field in self.fields:
             try:
-                column = self.get_column(field)
+                column = self._column(field)
                 if len(column) == 0:
                     warnings.append(f"La colonne '{field}' est vide")
             except Exception as e:
@@ -648,7 +932,7 @@ class JONXFile:
         # 4. Vérifier que tous les index peuvent être lus
         for index_field in self.indexes.keys():
             try:
-                idx = orjson.loads(zstd.ZstdDecompressor().decompress(self.indexes[index_field]))
+                idx = self._get_index(index_field)
                 if len(idx) == 0:
                     warnings.append(f"L'index pour '{index_field}' est vide")
                 elif len(idx) != self.count():
@@ -661,12 +945,7 @@ class JONXFile:
         
         # 5. Vérifier la cohérence des types
         for field, col_type in self.types.items():
-            # Gérer les types nullable
-            base_type = col_type
-            if isinstance(col_type, str) and col_type.startswith("nullable<") and col_type.endswith(">"):
-                base_type = col_type[9:-1]
-
-            if base_type not in SUPPORTED_TYPES:
+            if _parse_nullable_type(col_type)[1] not in SUPPORTED_TYPES:
                 warnings.append(f"Type inconnu pour la colonne '{field}': {col_type}")
         
         return {
@@ -1,14 +1,49 @@
+import logging
 import orjson
-import zstandard as zstd
 import os
 from .exceptions import (
     JONXValidationError,
     JONXEncodeError,
     JONXFileError,
 )
-from .utils.encoder import encode_to_bytes
+from .utils.encoder import encode_to_parts
+
+logger = logging.getLogger(__name__)
+
+# Nombre maximal de tampons par appel à os.writev
+_IOV_MAX = 1024
+
+
+def _write_parts(f, parts):
+    """
+    Écrit les morceaux d'un fichier JONX en un minimum d'appels système.
+
+    Utilise os.writev (écriture scatter-gather, sans concaténation) quand il
+    est disponible, sinon une seule écriture des morceaux joints.
+
+    Args:
+        f: Fichier ouvert en écriture binaire non bufferisée
+        parts: Liste de morceaux (bytes) à écrire dans l'ordre
+    """
+    if not hasattr(os, "writev"):
+        f.write(b"".join(parts))
+        return
+
+    fd = f.fileno()
+    views = [memoryview(p) for p in parts if len(p)]
+    i = 0
+    while i < len(views):
+        written = os.writev(fd, views[i:i + _IOV_MAX])
+        # Avancer sur les tampons écrits (l'écriture peut être partielle)
+        while written:
+            n = len(views[i])
+            if written >= n:
+                written -= n
+                i += 1
+            else:
+                views[i] = views[i][written:]
+                written = 0
 
-ZSTD = zstd.ZstdCompressor(level=7)
 
 # -----------------------------------------------------
 #   WRAPPER FICHIER
@@ -78,7 +113,7 @@ def jonx_encode(json_path, jonx_path):
     
     # Encoder les données
     try:
-        jonx_bytes = encode_to_bytes(data)
+        jonx_parts = encode_to_parts(data)
     except (JONXValidationError, JONXEncodeError) as e:
         # Ajouter le chemin du fichier aux détails
         if hasattr(e, 'details'):
@@ -92,12 +127,12 @@ def jonx_encode(json_path, jonx_path):
         if dest_dir and not os.path.exists(dest_dir):
             os.makedirs(dest_dir, exist_ok=True)
         
-        with open(jonx_path, "wb") as f:
-            f.write(jonx_bytes)
+        with open(jonx_path, "wb", buffering=0) as f:
+            _write_parts(f, jonx_parts)
     except IOError as e:
         raise JONXFileError(
             f"Impossible d'écrire le fichier JONX: {jonx_path}",
             {"path": jonx_path, "error": str(e)}
         ) from e
     
-    print(f"✅ JONX créé : {len(data)} lignes, {len(data[0])} colonnes")
+    logger.debug("JONX créé : %d lignes, %d colonnes", len(data), len(data[0]))
@@ -0,0 +1,195 @@
+"""
+Contextes Zstandard partagés pour l'encodage et le décodage JONX.
+
+Les contextes zstd sont coûteux à créer et ne sont pas thread-safe : on en
+conserve un par thread, réutilisé pour toutes les colonnes et tous les appels.
+
+Chaque trame porte la taille décompressée dans son en-tête
+(write_content_size=True) : le décodeur alloue le tampon de sortie en une
+seule fois, sans concaténation de morceaux.
+"""
+
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+import zstandard as zstd
+
+# Niveau de compression utilisé pour toutes les trames JONX
+ZSTD_LEVEL = 7
+
+# Volume total (en octets) à partir duquel les trames sont compressées en parallèle
+PARALLEL_MIN_BYTES = 1 << 20
+
+# Taille d'une trame à partir de laquelle zstd la découpe lui-même en jobs
+# répartis sur tous les cœurs (en dessous, le mode multithread n'apporte rien)
+MULTITHREAD_MIN_BYTES = 4 << 20
+
+# Dictionnaire zstd (contenu brut) partagé par l'encodeur et le décodeur pour
+# la trame du schéma (format v5+). Un schéma fait quelques centaines d'octets :
+# sans dictionnaire, zstd n'a aucun historique à exploiter et gagne peu.
+# NE JAMAIS MODIFIER : les fichiers v5 existants en dépendent.
+_SCHEMA_TYPES = (
+    "int8", "int16", "int32", "int64", "uint8", "uint16", "uint32", "uint64",
+    "float16", "float32", "float64", "bool", "string", "json", "binary",
+    "uuid", "date", "datetime", "timestamp_ms", "enum", "string_dict",
+)
+SCHEMA_DICT_CONTENT = (
+    b'{"fields":["id","name","email","date","price","value","status","type",'
+    b'"created_at","updated_at","timestamp","count"],"types":{'
+    + b",".join(
+        b'"%s":"%s","x":"nullable<%s>"' % (t.encode(), t.encode(), t.encode())
+        for t in _SCHEMA_TYPES
+    )
+    + b'},"enum_mappings":{},"string_dicts":{}}'
+)
+SCHEMA_DICT = zstd.ZstdCompressionDict(
+    SCHEMA_DICT_CONTENT, dict_type=zstd.DICT_TYPE_RAWCONTENT
+)
+
+_local = threading.local()
+_executor = None
+_executor_lock = threading.Lock()
+
+
+def get_compressor(size=0):
+    """
+    Retourne le compresseur zstd du thread courant.
+
+    Args:
+        size: Taille des données à compresser ; au-delà de
+              MULTITHREAD_MIN_BYTES, un compresseur multithread est utilisé
+
+    Returns:
+        zstd.ZstdCompressor: Compresseur réutilisable
+    """
+    if size >= MULTITHREAD_MIN_BYTES:
+        cctx = getattr(_local, "cctx_mt", None)
+        if cctx is None:
+            cctx = _local.cctx_mt = zstd.ZstdCompressor(
+                level=ZSTD_LEVEL, threads=-1, write_content_size=True
+            )
+        return cctx
+
+    cctx = getattr(_local, "cctx", None)
+    if cctx is None:
+        cctx = _local.cctx = zstd.ZstdCompressor(
+            level=ZSTD_LEVEL, write_content_size=True
+        )
+    return cctx
+
+
+def get_decompressor():
+    """
+    Retourne le décompresseur zstd du thread courant.
+
+    Returns:
+        zstd.ZstdDecompressor: Décompresseur réutilisable
+    """
+    dctx = getattr(_local, "dctx", None)
+    if dctx is None:
+        dctx = _local.dctx = zstd.ZstdDecompressor()
+    return dctx
+
+
+def get_schema_compressor():
+    """
+    Retourne le compresseur zstd du thread courant pour la trame du schéma
+    (amorcé avec SCHEMA_DICT).
+
+    Returns:
+        zstd.ZstdCompressor: Compresseur réutilisable
+    """
+    cctx = getattr(_local, "schema_cctx", None)
+    if cctx is None:
+        cctx = _local.schema_cctx = zstd.ZstdCompressor(
+            level=ZSTD_LEVEL, dict_data=SCHEMA_DICT, write_content_size=True
+        )
+    return cctx
+
+
+def get_schema_decompressor():
+    """
+    Retourne le décompresseur zstd du thread courant pour la trame du schéma
+    (amorcé avec SCHEMA_DICT).
+
+    Returns:
+        zstd.ZstdDecompressor: Décompresseur réutilisable
+    """
+    dctx = getattr(_local, "schema_dctx", None)
+    if dctx is None:
+        dctx = _local.schema_dctx = zstd.ZstdDecompressor(dict_data=SCHEMA_DICT)
+    return dctx
+
+
+def _get_executor():
+    """Retourne le pool de threads partagé (créé au premier usage)."""
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=os.cpu_count() or 1,
+                thread_name_prefix="jonx-zstd"
+            )
+    return _executor
+
+
+def _compress_one(blob):
+    return get_compressor(len(blob)).compress(blob)
+
+
+def compress_many(blobs):
+    """
+    Compresse plusieurs trames indépendantes.
+
+    Les trames d'au moins MULTITHREAD_MIN_BYTES sont compressées une à une
+    dans le thread appelant, par le contexte multithread (zstd les découpe
+    en jobs répartis sur tous les cœurs). Les autres sont réparties sur un
+    pool de threads au-delà de PARALLEL_MIN_BYTES au total (zstd relâche
+    le GIL, un contexte monothread par worker) : aucun worker n'utilise le
+    contexte multithread, qui lancerait cpu_count() jobs dans chacun d'eux.
+
+    Args:
+        blobs: Liste des données à compresser
+
+    Returns:
+        list: Trames compressées, dans le même ordre que blobs
+    """
+    frames = [None] * len(blobs)
+    small = []
+    for i, blob in enumerate(blobs):
+        if len(blob) >= MULTITHREAD_MIN_BYTES:
+            frames[i] = _compress_one(blob)
+        else:
+            small.append(i)
+
+    small_blobs = [blobs[i] for i in small]
+    if len(small_blobs) < 2 or sum(map(len, small_blobs)) < PARALLEL_MIN_BYTES:
+        compressed = map(_compress_one, small_blobs)
+    else:
+        compressed = _get_executor().map(_compress_one, small_blobs)
+    for i, frame in zip(small, compressed):
+        frames[i] = frame
+    return frames
+
+
+def _decompress_one(frame):
+    return get_decompressor().decompress(frame)
+
+
+def decompress_many(frames):
+    """
+    Décompresse plusieurs trames indépendantes.
+
+    Comme pour compress_many, zstd relâche le GIL : au-delà de
+    PARALLEL_MIN_BYTES de données compressées, les trames sont réparties
+    sur le pool de threads (un contexte zstd par thread).
+
+    Args:
+        frames: Liste de trames zstd (bytes ou memoryview)
+
+    Returns:
+        list: Données décompressées, dans le même ordre que frames
+    """
+    if len(frames) < 2 or sum(map(len, frames)) < PARALLEL_MIN_BYTES:
+        return [_decompress_one(frame) for frame in frames]
+    return list(_get_executor().map(_decompress_one, frames))
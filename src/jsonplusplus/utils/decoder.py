@@ -1,15 +1,22 @@
 import orjson
+import sys
 import zstandard as zstd
 import struct
+import mmap
 import numpy as np
 from datetime import datetime, date
 from uuid import UUID
+from .compression import decompress_many, get_decompressor, get_schema_decompressor
+from .packing import dictionary_code_dtype
 from ..exceptions import (
     JONXDecodeError,
     JONXSchemaError,
     JONXValidationError,
 )
 
+# Entier 32 bits non signé little-endian (tailles et compteurs de l'en-tête)
+_U32 = struct.Struct("<I")
+
 # Types numériques et leurs formats struct
 NUMERIC_TYPES = {
     "int8": ("b", 1),  # signed char
@@ -25,6 +32,24 @@ NUMERIC_TYPES = {
     "float64": ("d", 8),  # double
 }
 
+# Types numériques et leurs dtypes numpy (little-endian explicite)
+NUMPY_DTYPES = {
+    "int8": np.dtype("<i1"),
+    "int16": np.dtype("<i2"),
+    "int32": np.dtype("<i4"),
+    "int64": np.dtype("<i8"),
+    "uint8": np.dtype("<u1"),
+    "uint16": np.dtype("<u2"),
+    "uint32": np.dtype("<u4"),
+    "uint64": np.dtype("<u8"),
+    "float16": np.dtype("<f2"),
+    "float32": np.dtype("<f4"),
+    "float64": np.dtype("<f8"),
+}
+
+# Versions du format JONX lisibles par ce décodeur
+SUPPORTED_VERSIONS = (1, 2, 3, 4, 5, 6)
+
 
 def _parse_nullable_type(type_str):
     """
@@ -42,7 +67,24 @@ def _parse_nullable_type(type_str):
     return False, type_str
 
 
-def _decode_numeric_column(packed, col_type, field):
+def decode_index(raw, version):
+    """
+    Décode un index trié décompressé.
+
+    Args:
+        raw: Données décompressées de l'index
+        version: Version du format JONX du fichier
+
+    Returns:
+        np.ndarray | list: Indices des lignes triées par valeur croissante
+        (int32 binaire à partir de la v4, liste JSON avant)
+    """
+    if version >= 4:
+        return np.frombuffer(raw, dtype="<i4")
+    return orjson.loads(raw)
+
+
+def _decode_numeric_column(packed, col_type, field, schema=None):
     """
     Décode une colonne numérique.
 
@@ -50,9 +92,10 @@ def _decode_numeric_column(packed, col_type, field):
         packed: Données binaires compressées
         col_type: Type de la colonne
         field: Nom du champ (pour les messages d'erreur)
+        schema: Inutilisé (signature commune des décodeurs)
 
     Returns:
-        list: Valeurs décodées
+        np.ndarray: Valeurs décodées (vue sans copie sur les données)
     """
     if col_type not in NUMERIC_TYPES:
         raise JONXDecodeError(
@@ -60,7 +103,7 @@ def _decode_numeric_column(packed, col_type, field):
             {"field": field, "type": col_type}
         )
 
-    format_char, size = NUMERIC_TYPES[col_type]
+    size = NUMERIC_TYPES[col_type][1]
 
     if len(packed) % size != 0:
         raise JONXDecodeError(
@@ -68,24 +111,16 @@ def _decode_numeric_column(packed, col_type, field):
             {"field": field, "packed_size": len(packed), "expected_multiple": size}
         )
 
-    n = len(packed) // size
+    arr = np.frombuffer(packed, dtype=NUMPY_DTYPES[col_type])
 
-    # float16 nécessite numpy
+    # float16 est exposé en float32 (comme les valeurs Python d'origine)
     if col_type == "float16":
-        arr = np.frombuffer(packed, dtype=np.float16)
-        return arr.astype(np.float32).tolist()
+        return arr.astype(np.float32)
 
-    # Autres types numériques
-    try:
-        return list(struct.unpack(f"{n}{format_char}", packed))
-    except struct.error as e:
-        raise JONXDecodeError(
-            f"Erreur lors du décodage binaire de la colonne '{field}'",
-            {"field": field, "type": col_type, "error": str(e)}
-        ) from e
+    return arr
 
 
-def _decode_temporal_column(packed, col_type, field):
+def _decode_temporal_column(packed, col_type, field, schema=None):
     """
     Décode une colonne temporelle (date, datetime, timestamp_ms).
 
@@ -93,6 +128,7 @@ def _decode_temporal_column(packed, col_type, field):
         packed: Données binaires compressées
         col_type: Type de la colonne
         field: Nom du champ
+        schema: Inutilisé (signature commune des décodeurs)
 
     Returns:
         list: Valeurs décodées
@@ -105,6 +141,11 @@ def _decode_temporal_column(packed, col_type, field):
             {"field": field, "type": col_type, "error": str(e)}
         ) from e
 
+    return _convert_temporal(raw_data, col_type)
+
+
+def _convert_temporal(raw_data, col_type):
+    """Convertit les valeurs JSON d'une colonne temporelle en objets Python."""
     if col_type == "date":
         # Format ISO: "YYYY-MM-DD"
         return [datetime.fromisoformat(d).date() if d else None for d in raw_data]
@@ -133,6 +174,12 @@ def _decode_special_column(packed, col_type, field, schema):
     Returns:
         list: Valeurs décodées
     """
+    if col_type == "enum":
+        return _decode_codes(packed, schema.get("enum_mappings", {}).get(field, {}), col_type, field)
+
+    elif col_type == "string_dict":
+        return _decode_codes(packed, schema.get("string_dicts", {}).get(field, {}), col_type, field)
+
     try:
         raw_data = orjson.loads(packed)
     except orjson.JSONDecodeError as e:
@@ -141,22 +188,7 @@ def _decode_special_column(packed, col_type, field, schema):
             {"field": field, "type": col_type, "error": str(e)}
         ) from e
 
-    if col_type == "enum":
-        # Décoder les indices en valeurs via le mapping
-        enum_mappings = schema.get("enum_mappings", {})
-        mapping = enum_mappings.get(field, {})
-        # Inverser le mapping: {value: index} -> {index: value}
-        reverse_mapping = {v: k for k, v in mapping.items()}
-        return [reverse_mapping.get(idx) for idx in raw_data]
-
-    elif col_type == "string_dict":
-        # Décoder les indices en chaînes via le dictionnaire
-        string_dicts = schema.get("string_dicts", {})
-        dictionary = string_dicts.get(field, {})
-        # raw_data contient des indices, dictionary map index -> string
-        return [dictionary.get(str(idx)) if idx is not None else None for idx in raw_data]
-
-    elif col_type == "uuid":
+    if col_type == "uuid":
         # Convertir les chaînes en objets UUID
         return [UUID(u) if u else None for u in raw_data]
 
@@ -167,6 +199,39 @@ def _decode_special_column(packed, col_type, field, schema):
     return raw_data
 
 
+def _decode_codes(packed, mapping, col_type, field):
+    """
+    Décode les codes entiers d'une colonne enum / string_dict.
+
+    Args:
+        packed: Codes packés (dtype donné par dictionary_code_dtype)
+        mapping: Dictionnaire {valeur: code} stocké dans le schéma
+        col_type: Type de la colonne
+        field: Nom du champ
+
+    Returns:
+        list: Valeurs décodées (un seul objet str par valeur distincte)
+    """
+    dtype = dictionary_code_dtype(len(mapping))
+    if len(packed) % dtype.itemsize != 0:
+        raise JONXDecodeError(
+            f"Taille invalide pour la colonne {col_type} '{field}'",
+            {"field": field, "packed_size": len(packed), "expected_multiple": dtype.itemsize}
+        )
+
+    # Table code -> valeur, indexée en une seule opération numpy
+    lookup = np.empty(len(mapping), dtype=object)
+    lookup[list(mapping.values())] = list(mapping.keys())
+    codes = np.frombuffer(packed, dtype=dtype)
+    try:
+        return lookup[codes].tolist()
+    except IndexError as e:
+        raise JONXDecodeError(
+            f"Code hors du dictionnaire dans la colonne {col_type} '{field}'",
+            {"field": field, "type": col_type, "dictionary_size": len(mapping), "error": str(e)}
+        ) from e
+
+
 def _decode_nullable_column(packed, col_type, field, schema):
     """
     Décode une colonne nullable.
@@ -180,57 +245,151 @@ def _decode_nullable_column(packed, col_type, field, schema):
     Returns:
         list: Valeurs décodées avec None pour les valeurs nulles
     """
-    # Le format nullable stocke: [bitmap des nulls (bytes)] + [données compressées du type de base]
-    # Pour simplifier, on suppose que c'est géré dans pack_column/unpack_column
-    # et que les données décompressées contiennent déjà les None
-
+    # Le format nullable stocke: [bitmap des nulls, 1 bit par ligne, bit de
+    # poids faible en premier] + [valeurs non nulles packées selon le type de base]
     is_nullable, base_type = _parse_nullable_type(col_type)
 
-    # Décoder selon le type de base
-    if base_type in NUMERIC_TYPES:
-        return _decode_numeric_column(packed, base_type, field)
-    elif base_type in ("date", "datetime", "timestamp_ms"):
-        return _decode_temporal_column(packed, base_type, field)
-    elif base_type in ("enum", "string_dict", "uuid", "binary"):
-        return _decode_special_column(packed, base_type, field, schema)
-    elif base_type == "bool":
-        return [bool(b) if b != 255 else None for b in packed]  # 255 = null marker
+    num_rows = schema.get("num_rows") if schema else None
+    if num_rows is None:
+        # Avant la v6, le nombre de lignes (donc la taille du bitmap) est inconnu
+        if base_type == "bool":
+            return [bool(b) if b != 255 else None for b in packed]  # 255 = null marker
+        decoder = _COLUMN_DECODERS.get(base_type, _decode_json_column)
+        return decoder(packed, base_type, field, schema)
+
+    bitmap_size = (num_rows + 7) // 8
+    if len(packed) < bitmap_size:
+        raise JONXDecodeError(
+            f"Bitmap des nulls tronqué pour la colonne '{field}'",
+            {"field": field, "num_rows": num_rows, "packed_size": len(packed)}
+        )
+
+    bitmap = np.frombuffer(packed, dtype=np.uint8, count=bitmap_size)
+    is_null = np.unpackbits(bitmap, count=num_rows, bitorder="little").view(np.bool_)
+    present_rows = np.flatnonzero(~is_null).tolist()
+
+    result = [None] * num_rows
+    if not present_rows:
+        return result
+
+    data = packed[bitmap_size:]
+    if base_type == "bool":
+        # Les booléens non nuls restent sur un octet 0/1 (non bitpackés)
+        values = np.frombuffer(data, dtype=np.bool_)
     else:
-        # string ou autre
-        try:
-            return orjson.loads(packed)
-        except orjson.JSONDecodeError as e:
-            raise JONXDecodeError(
-                f"Erreur lors du parsing JSON de la colonne '{field}'",
-                {"field": field, "type": col_type, "error": str(e)}
-            ) from e
+        decoder = _COLUMN_DECODERS.get(base_type, _decode_json_column)
+        values = decoder(data, base_type, field, schema)
+
+    if len(values) != len(present_rows):
+        raise JONXDecodeError(
+            f"Nombre de valeurs incohérent pour la colonne nullable '{field}'",
+            {"field": field, "expected": len(present_rows), "actual": len(values)}
+        )
+
+    if isinstance(values, np.ndarray):
+        values = values.tolist()
+    for row, value in zip(present_rows, values):
+        result[row] = value
+    return result
 
 
-def decode_from_bytes(data: bytes) -> dict:
+def _decode_bool_column(packed, col_type, field, schema=None):
     """
-    Décode des bytes JONX en données JSON avec validation complète.
+    Décode une colonne booléenne : bitpackée à partir de la v6 (le schéma
+    porte alors num_rows), un octet 0/1 par valeur avant (vue sans copie).
+    """
+    num_rows = schema.get("num_rows") if schema else None
+    if num_rows is None:
+        return np.frombuffer(packed, dtype=np.bool_)
 
-    Supporte les types:
-    - Entiers signés: int8, int16, int32, int64
-    - Entiers non-signés: uint8, uint16, uint32, uint64
-    - Flottants: float16, float32, float64
-    - Booléens: bool
-    - Chaînes: string, string_dict
-    - Temporels: date, datetime, timestamp_ms
-    - Spéciaux: enum, uuid, binary
-    - Nullable: nullable<T> pour tout type T
+    if len(packed) != (num_rows + 7) // 8:
+        raise JONXDecodeError(
+            f"Taille incohérente pour la colonne booléenne '{field}'",
+            {"field": field, "num_rows": num_rows, "packed_size": len(packed)}
+        )
+    bits = np.unpackbits(np.frombuffer(packed, dtype=np.uint8), count=num_rows, bitorder="little")
+    return bits.view(np.bool_)
+
+
+def _decode_json_column(packed, col_type, field, schema=None):
+    """Décode une colonne stockée en JSON (string ou type inconnu)."""
+    try:
+        return orjson.loads(packed)
+    except orjson.JSONDecodeError as e:
+        raise JONXDecodeError(
+            f"Erreur lors du parsing JSON de la colonne '{field}'",
+            {"field": field, "type": col_type, "error": str(e)}
+        ) from e
+
+
+# Décodeur par type de base, signature commune (packed, col_type, field, schema) ;
+# les types absents (string, json...) sont décodés en JSON
+_COLUMN_DECODERS = {
+    **dict.fromkeys(NUMERIC_TYPES, _decode_numeric_column),
+    **dict.fromkeys(("date", "datetime", "timestamp_ms"), _decode_temporal_column),
+    **dict.fromkeys(("enum", "string_dict", "uuid", "binary"), _decode_special_column),
+    "bool": _decode_bool_column,
+}
+
+
+def decode_column(packed, col_type, field, schema):
+    """
+    Décode une colonne décompressée selon son type.
+
+    Point d'entrée commun à decode_from_bytes et à JONXFile.
 
     Args:
-        data: Données JONX à décoder
+        packed: Données décompressées de la colonne
+        col_type: Type de la colonne (éventuellement nullable<T>)
+        field: Nom du champ (pour les messages d'erreur)
+        schema: Schéma complet (enum_mappings, string_dicts)
 
     Returns:
-        dict: Dictionnaire avec version, fields, types, num_rows, json_data
+        np.ndarray | list: Tableau numpy pour les colonnes numériques et
+        booléennes, liste des valeurs pour les autres types
 
     Raises:
         JONXDecodeError: Si le décodage échoue
-        JONXValidationError: Si les données sont corrompues
     """
-    if not isinstance(data, bytes):
+    is_nullable, base_type = _parse_nullable_type(col_type)
+
+    try:
+        if is_nullable:
+            return _decode_nullable_column(packed, col_type, field, schema)
+        decoder = _COLUMN_DECODERS.get(base_type, _decode_json_column)
+        return decoder(packed, base_type, field, schema)
+
+    except JONXDecodeError:
+        raise
+    except Exception as e:
+        raise JONXDecodeError(
+            f"Erreur inattendue lors du décodage de la colonne '{field}'",
+            {"field": field, "type": col_type, "error": str(e)}
+        ) from e
+
+
+def read_layout(data):
+    """
+    Lit l'en-tête et le schéma d'un fichier JONX et repère les trames
+    compressées des colonnes et des index, sans les décompresser.
+
+    Les trames retournées sont des memoryview sur data (aucune copie).
+
+    Args:
+        data: Données JONX (bytes ou objet compatible buffer :
+              bytearray, memoryview, mmap)
+
+    Returns:
+        dict: Dictionnaire avec version, schema, fields, types,
+              columns ({champ: trame}), column_offsets ({champ: position
+              de la trame dans data}) et indexes ({champ: trame})
+
+    Raises:
+        JONXDecodeError: Si la structure est invalide
+        JONXValidationError: Si les données ne sont pas de type bytes
+        JONXSchemaError: Si le schéma est invalide
+    """
+    if not isinstance(data, (bytes, bytearray, memoryview, mmap.mmap)):
         raise JONXValidationError(
             "Les données doivent être de type bytes",
             {"type": type(data).__name__}
@@ -242,7 +401,7 @@ def decode_from_bytes(data: bytes) -> dict:
             {"data_length": len(data), "min_length": 8}
         )
 
-    if not data.startswith(b"JONX"):
+    if data[:4] != b"JONX":
         raise JONXDecodeError(
             "Le fichier n'est pas au format JONX (signature invalide)",
             {
@@ -252,20 +411,21 @@ def decode_from_bytes(data: bytes) -> dict:
         )
 
     try:
-        version = struct.unpack("I", data[4:8])[0]
+        version = _U32.unpack_from(data, 4)[0]
     except struct.error as e:
         raise JONXDecodeError(
             "Erreur lors de la lecture de la version",
             {"error": str(e)}
         ) from e
 
-    if version not in (1, 2, 3):
+    if version not in SUPPORTED_VERSIONS:
         raise JONXDecodeError(
             f"Version JONX non supportée: {version}",
-            {"version": version, "supported": [1, 2, 3]}
+            {"version": version, "supported": list(SUPPORTED_VERSIONS)}
         )
 
-    c = zstd.ZstdDecompressor()
+    # Vue sans copie : les trames découpées plus bas ne recopient pas data
+    data = memoryview(data)
     offset = 8
 
     # --- Lire le schéma ---
@@ -276,7 +436,7 @@ def decode_from_bytes(data: bytes) -> dict:
         )
 
     try:
-        schema_size = struct.unpack("I", data[offset:offset + 4])[0]
+        schema_size = _U32.unpack_from(data, offset)[0]
     except struct.error as e:
         raise JONXDecodeError(
             "Erreur lors de la lecture de la taille du schéma",
@@ -291,8 +451,11 @@ def decode_from_bytes(data: bytes) -> dict:
             {"offset": offset, "schema_size": schema_size, "data_length": len(data)}
         )
 
+    # À partir de la v5, le schéma est compressé avec le dictionnaire intégré
+    schema_dctx = get_schema_decompressor() if version >= 5 else get_decompressor()
+
     try:
-        schema_bytes = c.decompress(data[offset:offset + schema_size])
+        schema_bytes = schema_dctx.decompress(data[offset:offset + schema_size])
         schema = orjson.loads(schema_bytes)
     except zstd.ZstdError as e:
         raise JONXDecodeError(
@@ -346,9 +509,14 @@ def decode_from_bytes(data: bytes) -> dict:
                 {"field": field, "available_types": list(types.keys())}
             )
 
-    columns = {}
+    # Interner les noms de champs : toutes les clés des lignes (et les
+    # recherches par littéral, ex. row["id"]) partagent le même objet str
+    fields = [sys.intern(f) if isinstance(f, str) else f for f in fields]
+    schema["fields"] = fields
 
-    # --- Lire les colonnes ---
+    # --- Repérer les colonnes ---
+    column_frames = {}
+    column_offsets = {}
     for field in fields:
         if len(data) < offset + 4:
             raise JONXDecodeError(
@@ -357,7 +525,7 @@ def decode_from_bytes(data: bytes) -> dict:
             )
 
         try:
-            col_size = struct.unpack("I", data[offset:offset + 4])[0]
+            col_size = _U32.unpack_from(data, offset)[0]
         except struct.error as e:
             raise JONXDecodeError(
                 f"Erreur lors de la lecture de la taille de la colonne '{field}'",
@@ -372,64 +540,11 @@ def decode_from_bytes(data: bytes) -> dict:
                 {"field": field, "offset": offset, "col_size": col_size, "data_length": len(data)}
             )
 
-        try:
-            packed = c.decompress(data[offset:offset + col_size])
-        except zstd.ZstdError as e:
-            raise JONXDecodeError(
-                f"Erreur lors de la décompression de la colonne '{field}'",
-                {"field": field, "error": str(e)}
-            ) from e
-
+        column_frames[field] = data[offset:offset + col_size]
+        column_offsets[field] = offset
         offset += col_size
 
-        col_type = types[field]
-        is_nullable, base_type = _parse_nullable_type(col_type)
-
-        try:
-            # Décoder selon le type
-            if is_nullable:
-                columns[field] = _decode_nullable_column(packed, col_type, field, schema)
-            elif base_type in NUMERIC_TYPES:
-                columns[field] = _decode_numeric_column(packed, base_type, field)
-            elif base_type in ("date", "datetime", "timestamp_ms"):
-                columns[field] = _decode_temporal_column(packed, base_type, field)
-            elif base_type in ("enum", "string_dict", "uuid", "binary"):
-                columns[field] = _decode_special_column(packed, base_type, field, schema)
-            elif base_type == "bool":
-                columns[field] = [bool(b) for b in packed]
-            else:
-                # string ou type inconnu - fallback JSON
-                try:
-                    columns[field] = orjson.loads(packed)
-                except orjson.JSONDecodeError as e:
-                    raise JONXDecodeError(
-                        f"Erreur lors du parsing JSON de la colonne '{field}'",
-                        {"field": field, "type": col_type, "error": str(e)}
-                    ) from e
-
-        except JONXDecodeError:
-            raise
-        except Exception as e:
-            raise JONXDecodeError(
-                f"Erreur inattendue lors du décodage de la colonne '{field}'",
-                {"field": field, "type": col_type, "error": str(e)}
-            ) from e
-
-    # Vérifier que toutes les colonnes ont la même longueur
-    if fields:
-        expected_length = len(columns[fields[0]])
-        for field in fields[1:]:
-            if len(columns[field]) != expected_length:
-                raise JONXSchemaError(
-                    f"La colonne '{field}' a une longueur incohérente",
-                    {
-                        "field": field,
-                        "expected_length": expected_length,
-                        "actual_length": len(columns[field])
-                    }
-                )
-
-    # --- Lire les index (ignorés pour la reconstruction) ---
+    # --- Repérer les index ---
     if len(data) < offset + 4:
         raise JONXDecodeError(
             "Données insuffisantes pour lire le nombre d'index",
@@ -437,7 +552,7 @@ def decode_from_bytes(data: bytes) -> dict:
         )
 
     try:
-        num_indexes = struct.unpack("I", data[offset:offset + 4])[0]
+        num_indexes = _U32.unpack_from(data, offset)[0]
     except struct.error as e:
         raise JONXDecodeError(
             "Erreur lors de la lecture du nombre d'index",
@@ -446,6 +561,7 @@ def decode_from_bytes(data: bytes) -> dict:
 
     offset += 4
 
+    index_frames = {}
     for i in range(num_indexes):
         if len(data) < offset + 4:
             raise JONXDecodeError(
@@ -454,7 +570,7 @@ def decode_from_bytes(data: bytes) -> dict:
             )
 
         try:
-            name_len = struct.unpack("I", data[offset:offset + 4])[0]
+            name_len = _U32.unpack_from(data, offset)[0]
         except struct.error as e:
             raise JONXDecodeError(
                 f"Erreur lors de la lecture de la taille du nom d'index {i}",
@@ -469,6 +585,7 @@ def decode_from_bytes(data: bytes) -> dict:
                 {"index": i, "offset": offset, "name_len": name_len, "data_length": len(data)}
             )
 
+        name = bytes(data[offset:offset + name_len]).decode("utf-8")
         offset += name_len
 
         if len(data) < offset + 4:
@@ -478,7 +595,7 @@ def decode_from_bytes(data: bytes) -> dict:
             )
 
         try:
-            idx_size = struct.unpack("I", data[offset:offset + 4])[0]
+            idx_size = _U32.unpack_from(data, offset)[0]
         except struct.error as e:
             raise JONXDecodeError(
                 f"Erreur lors de la lecture de la taille de l'index {i}",
@@ -493,20 +610,178 @@ def decode_from_bytes(data: bytes) -> dict:
                 {"index": i, "offset": offset, "idx_size": idx_size, "data_length": len(data)}
             )
 
+        index_frames[name] = data[offset:offset + idx_size]
         offset += idx_size
 
-    # --- Reconstruire JSON ---
-    num_rows = len(columns[fields[0]]) if fields else 0
-    json_data = [
-        {field: columns[field][i] for field in fields}
-        for i in range(num_rows)
+    return {
+        "version": version,
+        "schema": schema,
+        "fields": fields,
+        "types": types,
+        "columns": column_frames,
+        "column_offsets": column_offsets,
+        "indexes": index_frames,
+    }
+
+
+def decode_from_bytes(data: bytes, rows: bool = True) -> dict:
+    """
+    Décode des bytes JONX en données JSON avec validation complète.
+
+    Supporte les types:
+    - Entiers signés: int8, int16, int32, int64
+    - Entiers non-signés: uint8, uint16, uint32, uint64
+    - Flottants: float16, float32, float64
+    - Booléens: bool
+    - Chaînes: string, string_dict
+    - Temporels: date, datetime, timestamp_ms
+    - Spéciaux: enum, uuid, binary
+    - Nullable: nullable<T> pour tout type T
+
+    Args:
+        data: Données JONX à décoder (bytes ou objet compatible buffer :
+              bytearray, memoryview, mmap)
+        rows: Si False, les lignes ne sont pas reconstruites
+              (json_data vaut None, seules les colonnes sont retournées)
+
+    Returns:
+        dict: Dictionnaire avec version, fields, types, num_rows,
+              columns (données colonnées {champ: valeurs}) et json_data
+
+    Raises:
+        JONXDecodeError: Si le décodage échoue
+        JONXValidationError: Si les données sont corrompues
+    """
+    layout = read_layout(data)
+    fields = layout["fields"]
+    types = layout["types"]
+    schema = layout["schema"]
+
+    frames = layout["columns"]
+
+    # --- Décompresser les colonnes (en parallèle si volumineuses) ---
+    try:
+        packed_columns = decompress_many(list(frames.values()))
+    except zstd.ZstdError:
+        # Retrouver la colonne fautive pour un message précis
+        c = get_decompressor()
+        for field, frame in frames.items():
+            try:
+                c.decompress(frame)
+            except zstd.ZstdError as e:
+                raise JONXDecodeError(
+                    f"Erreur lors de la décompression de la colonne '{field}'",
+                    {"field": field, "error": str(e)}
+                ) from e
+        raise
+
+    # --- Décoder les colonnes (liste dans l'ordre de fields) ---
+    cols = [
+        decode_column(packed, types[field], field, schema)
+        for field, packed in zip(frames, packed_columns)
     ]
 
+    # Vérifier que toutes les colonnes ont la même longueur
+    # (read_layout garantit au moins une colonne)
+    num_rows = len(cols[0])
+    for field, col in zip(fields[1:], cols[1:]):
+        if len(col) != num_rows:
+            raise JONXSchemaError(
+                f"La colonne '{field}' a une longueur incohérente",
+                {
+                    "field": field,
+                    "expected_length": num_rows,
+                    "actual_length": len(col)
+                }
+            )
+
+    columns = dict(zip(fields, cols))
+
+    # --- Reconstruire JSON ---
+    json_data = None
+    if rows:
+        # Transposition colonnes -> lignes en une seule passe zip (niveau C)
+        # Les colonnes numpy sont converties en listes Python une seule fois ici
+        col_lists = [
+            col.tolist() if isinstance(col, np.ndarray) else col
+            for col in cols
+        ]
+        json_data = [dict(zip(fields, row)) for row in zip(*col_lists)]
+
     return {
-        "version": version,
+        "version": layout["version"],
         "fields": fields,
         "types": types,
         "num_rows": num_rows,
+        "columns": columns,
         "json_data": json_data,
         "schema": schema  # Inclure le schéma complet pour debug
-    }
\ No newline at end of file
+    }
+
+
+def decode_value(packed, col_type, field, schema, row):
+    """
+    Décode une seule valeur d'une colonne décompressée, sans décoder
+    la colonne entière (lecture directe dans le tampon pour les types
+    numériques, une seule conversion pour les types temporels).
+
+    Args:
+        packed: Données décompressées de la colonne
+        col_type: Type de la colonne (éventuellement nullable<T>)
+        field: Nom du champ (pour les messages d'erreur)
+        schema: Schéma complet (enum_mappings, string_dicts)
+        row: Numéro de ligne
+
+    Returns:
+        Valeur Python native
+
+    Raises:
+        JONXDecodeError: Si le décodage échoue ou si la ligne n'existe pas
+    """
+    dtype = NUMPY_DTYPES.get(col_type)
+    if dtype is not None:
+        if not 0 <= row < len(packed) // dtype.itemsize:
+            raise JONXDecodeError(
+                f"Ligne {row} hors limites pour la colonne '{field}'",
+                {"field": field, "row": row, "packed_size": len(packed)}
+            )
+        return np.frombuffer(packed, dtype=dtype, count=1, offset=row * dtype.itemsize)[0].item()
+
+    if col_type in ("date", "datetime", "timestamp_ms"):
+        try:
+            raw_data = orjson.loads(packed)
+            return _convert_temporal([raw_data[row]], col_type)[0]
+        except (orjson.JSONDecodeError, IndexError, TypeError, ValueError) as e:
+            raise JONXDecodeError(
+                f"Erreur lors du décodage de la ligne {row} de la colonne '{field}'",
+                {"field": field, "type": col_type, "row": row, "error": str(e)}
+            ) from e
+
+    column = decode_column(packed, col_type, field, schema)
+    if not 0 <= row < len(column):
+        raise JONXDecodeError(
+            f"Ligne {row} hors limites pour la colonne '{field}'",
+            {"field": field, "row": row, "num_rows": len(column)}
+        )
+    value = column[row]
+    return value.item() if isinstance(value, np.generic) else value
+
+
+def decode_to_columns(data) -> dict:
+    """
+    Décode des bytes JONX sous forme colonnée uniquement, sans aucune
+    reconstruction ligne par ligne.
+
+    Args:
+        data: Données JONX à décoder (bytes ou objet compatible buffer :
+              bytearray, memoryview, mmap)
+
+    Returns:
+        dict: {champ: valeurs} dans l'ordre du schéma (np.ndarray pour les
+              colonnes numériques et booléennes, list sinon)
+
+    Raises:
+        JONXDecodeError: Si le décodage échoue
+        JONXValidationError: Si les données sont corrompues
+    """
+    return decode_from_bytes(data, rows=False)["columns"]
@@ -1,17 +1,18 @@
 import orjson
-import zstandard as zstd
 import struct
-import io
+import numpy as np
 from datetime import datetime
+from itertools import islice
+from operator import itemgetter
 from ..exceptions import (
     JONXValidationError,
     JONXEncodeError,
     JONXSchemaError
 )
+from .compression import compress_many, get_schema_compressor
+from .decoder import NUMPY_DTYPES
 from .packing import pack_column
-from .type_detection import detect_type
-
-ZSTD = zstd.ZstdCompressor(level=7)
+from .type_detection import detect_column_type
 
 # Types supportés
 NUMERIC_TYPES = {
@@ -23,6 +24,16 @@ NUMERIC_TYPES = {
 TEMPORAL_TYPES = {"date", "datetime", "timestamp_ms"}
 INDEXABLE_TYPES = NUMERIC_TYPES | TEMPORAL_TYPES
 
+# Version du format écrite dans l'en-tête
+# (v4 : index triés stockés en int32 little-endian au lieu de listes JSON,
+#  v5 : schéma compressé avec le dictionnaire zstd intégré,
+#  v6 : nombre de lignes dans le schéma et booléens bitpackés)
+JONX_VERSION = 6
+
+# Entier 32 bits non signé little-endian (tailles et compteurs de l'en-tête),
+# comme lu par le décodeur, quel que soit l'ordre natif de la machine
+_U32 = struct.Struct("<I")
+
 
 # -----------------------------------------------------
 #   ENCODER PRINCIPAL
@@ -58,24 +69,26 @@ def _validate_json_data(json_data):
                 {"index": i, "type": type(item).__name__}
             )
 
-    # Vérifier que tous les objets ont les mêmes clés
-    first_keys = set(json_data[0].keys())
+    # Vérifier que tous les objets ont les mêmes clés (comparaison directe
+    # des vues dict_keys, sans construire un set par ligne)
+    first_keys = json_data[0].keys()
     if len(first_keys) == 0:
         raise JONXValidationError(
             "Les objets JSON doivent avoir au moins une clé",
             {"num_rows": len(json_data)}
         )
 
-    for i, item in enumerate(json_data[1:], start=1):
-        item_keys = set(item.keys())
-        if item_keys != first_keys:
-            missing = first_keys - item_keys
-            extra = item_keys - first_keys
+    for i, item in enumerate(islice(json_data, 1, None), 1):
+        if item.keys() != first_keys:
+            expected = set(first_keys)
+            item_keys = set(item.keys())
+            missing = expected - item_keys
+            extra = item_keys - expected
             raise JONXSchemaError(
                 f"L'objet à l'index {i} a un schéma différent",
                 {
                     "index": i,
-                    "expected_keys": sorted(first_keys),
+                    "expected_keys": sorted(expected),
                     "actual_keys": sorted(item_keys),
                     "missing_keys": sorted(missing) if missing else None,
                     "extra_keys": sorted(extra) if extra else None
@@ -99,9 +112,80 @@ def _parse_nullable_type(type_str):
     return False, type_str
 
 
-def encode_to_bytes(json_data):
+def _build_code_mapping(values):
     """
-    Encode des données JSON en bytes JONX avec validation complète.
+    Construit le dictionnaire {valeur: code} d'une colonne enum / string_dict
+    (valeurs distinctes non nulles, codes attribués par ordre d'apparition).
+
+    Args:
+        values: Liste de valeurs (None ignorés)
+
+    Returns:
+        dict: {valeur: code}
+    """
+    unique = dict.fromkeys(values)
+    unique.pop(None, None)
+    # str.__str__ ramène les sous-classes de str à des clés str simples,
+    # seules acceptées par orjson dans le schéma
+    return {str.__str__(v): i for i, v in enumerate(unique)}
+
+
+def _build_sorted_index(values):
+    """
+    Calcule la permutation qui trie une colonne (tri stable, None en tête).
+
+    Le tri est délégué à numpy (argsort en C) au lieu d'un sorted() Python
+    avec une clé appelée à chaque comparaison.
+
+    Args:
+        values: Liste (ou tableau numpy) des valeurs de la colonne
+
+    Returns:
+        np.ndarray: Indices des lignes dans l'ordre croissant des valeurs
+    """
+    if not isinstance(values, np.ndarray) and None in values:
+        is_null = np.fromiter((v is None for v in values), dtype=bool, count=len(values))
+        null_idx = np.flatnonzero(is_null)
+        present_idx = np.flatnonzero(~is_null)
+        present = np.asarray([values[i] for i in present_idx.tolist()])
+        order = present_idx[np.argsort(present, kind="stable")]
+        return np.concatenate((null_idx, order))
+
+    return np.argsort(np.asarray(values), kind="stable")
+
+
+def _column_stats(packed, col_type, sorted_idx):
+    """
+    Calcule le min/max d'une colonne numérique sur les valeurs stockées
+    (après conversion dans le type de la colonne, ex: float32).
+
+    Args:
+        packed: Données packées de la colonne
+        col_type: Type numérique de la colonne
+        sorted_idx: Index trié de la colonne
+
+    Returns:
+        dict | None: {"min": ..., "max": ...}, ou None si une borne n'est pas
+        représentable en JSON (NaN, infini)
+    """
+    if len(sorted_idx) == 0:
+        return None
+    stored = np.frombuffer(packed, dtype=NUMPY_DTYPES[col_type])
+    lo = stored[sorted_idx[0]].item()
+    hi = stored[sorted_idx[-1]].item()
+    if isinstance(lo, float) and not (np.isfinite(lo) and np.isfinite(hi)):
+        return None
+    return {"min": lo, "max": hi}
+
+
+def encode_to_parts(json_data):
+    """
+    Encode des données JSON en JONX, sous forme de liste de morceaux
+    (en-têtes et trames compressées) à concaténer dans l'ordre.
+
+    Évite de recopier les trames dans un tampon intermédiaire : les
+    morceaux peuvent être écrits tels quels (os.writev) ou joints une
+    seule fois.
 
     Supporte les types:
     - Entiers signés: int8, int16, int32, int64
@@ -117,7 +201,7 @@ def encode_to_bytes(json_data):
         json_data: Liste d'objets JSON à encoder
 
     Returns:
-        bytes: Données JONX encodées
+        list[bytes]: Morceaux du fichier JONX
 
     Raises:
         JONXValidationError: Si les données sont invalides
@@ -128,7 +212,13 @@ def encode_to_bytes(json_data):
         _validate_json_data(json_data)
 
         fields = list(json_data[0].keys())
-        columns = {f: [row[f] for row in json_data] for f in fields}
+
+        # Transposition lignes -> colonnes en une seule passe (itemgetter + zip en C)
+        if len(fields) == 1:
+            columns = {fields[0]: list(map(itemgetter(fields[0]), json_data))}
+        else:
+            rows = map(itemgetter(*fields), json_data)
+            columns = dict(zip(fields, map(list, zip(*rows))))
 
         # Vérifier que toutes les colonnes ont la même longueur
         expected_length = len(json_data)
@@ -155,7 +245,12 @@ def encode_to_bytes(json_data):
                     {"field": f}
                 )
             try:
-                detected = detect_type(col)
+                # Le tableau numpy construit pendant la détection (colonnes
+                # numériques) remplace la liste : ni l'index ni le packing
+                # n'ont à reconvertir les valeurs
+                detected, arr = detect_column_type(col)
+                if arr is not None:
+                    columns[f] = arr
 
                 # Gérer les types complexes retournés comme dict
                 if isinstance(detected, dict):
@@ -179,14 +274,22 @@ def encode_to_bytes(json_data):
                 else:
                     types[f] = detected
 
+                # detect_type ne renvoie que le nom du type : construire le
+                # dictionnaire des colonnes enum / string_dict
+                base_type = _parse_nullable_type(types[f])[1]
+                if base_type == "enum" and not enum_mappings.get(f):
+                    enum_mappings[f] = _build_code_mapping(col)
+                elif base_type == "string_dict" and not string_dicts.get(f):
+                    string_dicts[f] = _build_code_mapping(col)
+
             except Exception as e:
                 raise JONXEncodeError(
                     f"Erreur lors de la détection du type pour la colonne '{f}'",
                     {"field": f, "error": str(e)}
                 ) from e
 
-        # Compression colonnes
-        compressed_columns = {}
+        # Packing des colonnes
+        packed_columns = {}
         for f in fields:
             try:
                 # Préparer les métadonnées pour pack_column
@@ -199,8 +302,7 @@ def encode_to_bytes(json_data):
                 elif base_type == "string_dict" or (is_nullable and base_type == "string_dict"):
                     pack_kwargs["string_dict"] = string_dicts.get(f, {})
 
-                blob = pack_column(columns[f], types[f], **pack_kwargs)
-                compressed_columns[f] = ZSTD.compress(blob)
+                packed_columns[f] = pack_column(columns[f], types[f], **pack_kwargs)
             except Exception as e:
                 raise JONXEncodeError(
                     f"Erreur lors de l'encodage de la colonne '{f}'",
@@ -209,6 +311,9 @@ def encode_to_bytes(json_data):
 
         # Index auto (types numériques et temporels)
         indexes = {}
+        # Min/max des colonnes numériques, stockés dans le schéma pour que
+        # find_min/find_max n'aient rien à décompresser
+        stats = {}
 
         for f, t in types.items():
             # Parse nullable type
@@ -216,31 +321,36 @@ def encode_to_bytes(json_data):
 
             if base_type in INDEXABLE_TYPES:
                 try:
-                    # Fonction de tri qui gère les None
-                    def sort_key(i):
-                        val = columns[f][i]
-                        if val is None:
-                            return float('-inf')
-                        return val
-
-                    sorted_idx = sorted(range(len(columns[f])), key=sort_key)
-                    indexes[f] = ZSTD.compress(orjson.dumps(sorted_idx))
+                    sorted_idx = _build_sorted_index(columns[f])
+                    indexes[f] = sorted_idx.astype("<i4").tobytes()
+                    if t in NUMPY_DTYPES:
+                        stats[f] = _column_stats(packed_columns[f], t, sorted_idx)
                 except Exception as e:
                     raise JONXEncodeError(
                         f"Erreur lors de la création de l'index pour '{f}'",
                         {"field": f, "error": str(e)}
                     ) from e
 
-        out = io.BytesIO()
+        # Compression des colonnes et des index (trames indépendantes,
+        # compressées en parallèle sur plusieurs cœurs si volumineuses)
+        try:
+            frames = compress_many(list(packed_columns.values()) + list(indexes.values()))
+        except Exception as e:
+            raise JONXEncodeError(
+                "Erreur lors de la compression des colonnes",
+                {"error": str(e)}
+            ) from e
+        compressed_columns = dict(zip(packed_columns, frames))
+        indexes = dict(zip(indexes, frames[len(packed_columns):]))
 
         # Header
-        out.write(b"JONX")
-        out.write(struct.pack("I", 3))  # Version 3 pour tous les nouveaux types
+        parts = [b"JONX", _U32.pack(JONX_VERSION)]
 
         # Schema avec toutes les métadonnées
         schema = {
             "fields": fields,
             "types": types,
+            "num_rows": len(json_data),
         }
 
         # Ajouter les métadonnées optionnelles seulement si présentes
@@ -248,11 +358,14 @@ def encode_to_bytes(json_data):
             schema["enum_mappings"] = enum_mappings
         if string_dicts:
             schema["string_dicts"] = string_dicts
+        stats = {f: st for f, st in stats.items() if st is not None}
+        if stats:
+            schema["stats"] = stats
 
         try:
-            schema_bytes = ZSTD.compress(orjson.dumps(schema))
-            out.write(struct.pack("I", len(schema_bytes)))
-            out.write(schema_bytes)
+            schema_bytes = get_schema_compressor().compress(orjson.dumps(schema))
+            parts.append(_U32.pack(len(schema_bytes)))
+            parts.append(schema_bytes)
         except Exception as e:
             raise JONXEncodeError(
                 "Erreur lors de l'encodage du schéma",
@@ -262,18 +375,19 @@ def encode_to_bytes(json_data):
         # Colonnes
         for f in fields:
             col = compressed_columns[f]
-            out.write(struct.pack("I", len(col)))
-            out.write(col)
+            parts.append(_U32.pack(len(col)))
+            parts.append(col)
 
-        # Index
-        out.write(struct.pack("I", len(indexes)))
+        # Index (la taille du nom est celle de son encodage UTF-8)
+        parts.append(_U32.pack(len(indexes)))
         for f, idx in indexes.items():
-            out.write(struct.pack("I", len(f)))
-            out.write(f.encode("utf-8"))
-            out.write(struct.pack("I", len(idx)))
-            out.write(idx)
+            name = f.encode("utf-8")
+            parts.append(_U32.pack(len(name)))
+            parts.append(name)
+            parts.append(_U32.pack(len(idx)))
+            parts.append(idx)
 
-        return out.getvalue()
+        return parts
 
     except (JONXValidationError, JONXSchemaError, JONXEncodeError):
         # Re-raise les exceptions personnalisées
@@ -283,4 +397,23 @@ def encode_to_bytes(json_data):
         raise JONXEncodeError(
             "Erreur inattendue lors de l'encodage",
             {"error": str(e), "error_type": type(e).__name__}
-        ) from e
\ No newline at end of file
+        ) from e
+
+
+def encode_to_bytes(json_data):
+    """
+    Encode des données JSON en bytes JONX avec validation complète.
+
+    Voir encode_to_parts pour les types supportés.
+
+    Args:
+        json_data: Liste d'objets JSON à encoder
+
+    Returns:
+        bytes: Données JONX encodées
+
+    Raises:
+        JONXValidationError: Si les données sont invalides
+        JONXEncodeError: Si l'encodage échoue
+    """
+    return b"".join(encode_to_parts(json_data))
@@ -1,5 +1,4 @@
 import orjson
-import struct
 import numpy as np
 from datetime import datetime, date
 from uuid import UUID
@@ -40,22 +39,25 @@ def _pack_numeric(values, col_type):
     Pack une colonne numérique.
 
     Args:
-        values: Liste de valeurs numériques
+        values: Liste (ou tableau numpy) de valeurs numériques
         col_type: Type numérique (int8, int16, ..., float64)
 
     Returns:
         bytes: Données packées
     """
     if col_type == "float16":
-        # float16 nécessite numpy
-        arr = np.array(values, dtype=np.float16)
-        return arr.tobytes()
+        dtype = "<f2"
+    elif col_type in NUMERIC_PACK_FORMATS:
+        # Les codes struct coïncident avec les codes de type numpy
+        dtype = "<" + NUMERIC_PACK_FORMATS[col_type]
+    else:
+        raise ValueError(f"Type numérique inconnu: {col_type}")
 
-    if col_type in NUMERIC_PACK_FORMATS:
-        fmt = NUMERIC_PACK_FORMATS[col_type]
-        return struct.pack(f"{len(values)}{fmt}", *values)
+    if isinstance(values, np.ndarray):
+        return values.astype(dtype, copy=False).tobytes()
 
-    raise ValueError(f"Type numérique inconnu: {col_type}")
+    # Conversion en un seul passage C, taille connue
+    return np.fromiter(values, dtype=dtype, count=len(values)).tobytes()
 
 
 def _pack_temporal(values, col_type):
@@ -94,6 +96,46 @@ def _pack_temporal(values, col_type):
     return orjson.dumps(serialized)
 
 
+def dictionary_code_dtype(size):
+    """
+    Retourne le dtype des codes d'une colonne enum / string_dict : le plus
+    petit entier non signé little-endian capable d'indexer size valeurs.
+
+    Args:
+        size: Nombre de valeurs distinctes du dictionnaire
+
+    Returns:
+        np.dtype: uint8, uint16 ou uint32
+    """
+    if size <= 1 << 8:
+        return np.dtype("<u1")
+    if size <= 1 << 16:
+        return np.dtype("<u2")
+    return np.dtype("<u4")
+
+
+def _pack_codes(values, mapping):
+    """
+    Remplace chaque valeur par son code dans le dictionnaire et pack les
+    codes en binaire (voir dictionary_code_dtype).
+
+    Args:
+        values: Liste de valeurs
+        mapping: Dictionnaire {valeur: code}
+
+    Returns:
+        bytes: Codes packés
+
+    Raises:
+        KeyError: Si une valeur est absente du dictionnaire
+    """
+    return np.fromiter(
+        map(mapping.__getitem__, values),
+        dtype=dictionary_code_dtype(len(mapping)),
+        count=len(values)
+    ).tobytes()
+
+
 def _pack_enum(values, enum_mapping):
     """
     Pack une colonne enum en utilisant le mapping fourni.
@@ -103,11 +145,9 @@ def _pack_enum(values, enum_mapping):
         enum_mapping: Dictionnaire {value: index}
 
     Returns:
-        bytes: Indices packés en JSON
+        bytes: Indices packés en binaire
     """
-    # Convertir les valeurs en indices selon le mapping
-    indices = [enum_mapping.get(v) for v in values]
-    return orjson.dumps(indices)
+    return _pack_codes(values, enum_mapping)
 
 
 def _pack_string_dict(values, string_dict):
@@ -119,11 +159,9 @@ def _pack_string_dict(values, string_dict):
         string_dict: Dictionnaire {string: index}
 
     Returns:
-        bytes: Indices packés en JSON
+        bytes: Indices packés en binaire
     """
-    # Convertir les chaînes en indices selon le dictionnaire
-    indices = [string_dict.get(v) for v in values]
-    return orjson.dumps(indices)
+    return _pack_codes(values, string_dict)
 
 
 def _pack_uuid(values):
@@ -143,6 +181,33 @@ def _pack_uuid(values):
     return orjson.dumps(serialized)
 
 
+def _pack_bool(values):
+    """
+    Pack une colonne booléenne (un octet 0/1 par valeur).
+
+    Args:
+        values: Liste de booléens
+
+    Returns:
+        bytes: Octets 0/1
+    """
+    return np.asarray(values, dtype=np.bool_).view(np.uint8).tobytes()
+
+
+def _pack_bool_bits(values):
+    """
+    Pack une colonne booléenne sur 1 bit par valeur (bit de poids faible
+    en premier), soit 8 fois moins de données à compresser.
+
+    Args:
+        values: Liste de booléens
+
+    Returns:
+        bytes: ceil(n / 8) octets
+    """
+    return np.packbits(np.asarray(values, dtype=np.bool_), bitorder="little").tobytes()
+
+
 def _pack_nullable(values, base_type, **kwargs):
     """
     Pack une colonne nullable en séparant le bitmap des nulls et les données.
@@ -187,7 +252,7 @@ def _pack_nullable(values, base_type, **kwargs):
     elif base_type == "uuid":
         data_packed = _pack_uuid(non_null_values)
     elif base_type == "bool":
-        data_packed = bytes((1 if v else 0) for v in non_null_values)
+        data_packed = _pack_bool(non_null_values)
     elif base_type == "binary":
         data_packed = orjson.dumps(non_null_values)
     else:
@@ -233,7 +298,7 @@ def pack_column(values, col_type, **kwargs):
         b'\\x00\\x00\\xc0?\\x00\\x00 @'
 
         >>> pack_column(["a", "b", "a"], "enum", enum_mapping={"a": 0, "b": 1})
-        b'[0,1,0]'
+        b'\\x00\\x01\\x00'
 
         >>> pack_column([1, None, 3], "nullable<int32>")
         b'\\x02...'  # bitmap + données compressées
@@ -248,9 +313,9 @@ def pack_column(values, col_type, **kwargs):
     if base_type in NUMERIC_PACK_FORMATS or base_type == "float16":
         return _pack_numeric(values, base_type)
 
-    # Booléen
+    # Booléen (bitpacké ; le décodeur lit le nombre de lignes dans le schéma)
     if base_type == "bool":
-        return bytes((1 if v else 0) for v in values)
+        return _pack_bool_bits(values)
 
     # Types temporels
     if base_type in ("date", "datetime", "timestamp_ms"):
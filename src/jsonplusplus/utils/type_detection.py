@@ -1,5 +1,6 @@
 
 import uuid
+import numpy as np
 from datetime import datetime
 # -----------------------------------------------------
 #   TYPE DETECTION
@@ -40,9 +41,9 @@ def is_datetime(v):
         return False
 
 def detect_numeric_type_int(values):
-    min_v = min(values)
-    max_v = max(values)
+    return _int_type_for_range(min(values), max(values))
 
+def _int_type_for_range(min_v, max_v):
     if min_v >= 0:
         for name, lo, hi in UINT_RANGES:
             if lo <= min_v and max_v <= hi:
@@ -55,53 +56,116 @@ def detect_numeric_type_int(values):
     return "int64"
 
 def detect_numeric_type_float(values):
-    # IEEE 754
-    F16_MIN, F16_MAX = -65504, 65504
-    F32_MIN, F32_MAX = -3.4e38, 3.4e38
-
-    fits_f16 = True
-    fits_f32 = True
-
-    for v in values:
-        if not (F16_MIN <= v <= F16_MAX) or round(v, 3) != v:
-            fits_f16 = False
-        if not (F32_MIN <= v <= F32_MAX):
-            fits_f32 = False
-
-    if fits_f16:
+    # Tests de plage et de précision vectorisés (une seule conversion en
+    # float64, puis comparaisons en C au lieu d'une boucle Python)
+    return _float_type_for_array(np.asarray(values, dtype=np.float64))
+
+def _float_type_for_array(a):
+    # IEEE 754 ; NaN et infinis ne tiennent que dans float64
+    F16_MAX = 65504
+    F32_MAX = 3.4e38
+    abs_a = np.abs(a)
+    if np.all(abs_a <= F16_MAX) and np.array_equal(np.round(a, 3), a):
         return "float16"
-    if fits_f32:
+    if np.all(abs_a <= F32_MAX):
         return "float32"
     return "float64"
 
+def _detect_ndarray_type(arr):
+    # Tableau numpy homogène : min/max et tests de plage en C, sans boucle
+    # Python. Retourne None si le dtype n'a pas de type JONX direct.
+    kind = arr.dtype.kind
+
+    if kind == "b":
+        return "bool"
+
+    if kind in "iu":
+        return _int_type_for_range(arr.min().item(), arr.max().item())
+
+    if kind == "f":
+        return _float_type_for_array(arr.astype(np.float64, copy=False))
+
+    return None
+
 def detect_type(values):
+    return detect_column_type(values)[0]
+
+# Types de base de la table de décision, dans l'ordre de test : bool avant
+# int (bool est une sous-classe d'int), bytes/bytearray regroupés
+_BASE_KINDS = (bool, int, float, str, bytes, bytearray)
+
+def _base_kind(kind):
+    # Ramène une sous-classe (np.float64, IntEnum, sous-classe de str...) à
+    # son type de base ; les types inconnus sont conservés tels quels
+    for base in _BASE_KINDS:
+        if issubclass(kind, base):
+            return base
+    return kind
+
+def detect_column_type(values):
+    # Comme detect_type, mais retourne aussi (type, tableau) : pour une
+    # colonne numérique non nullable, le tableau numpy construit pendant la
+    # détection (dtype détecté pour les entiers, float64 pour les flottants)
+    # est réutilisé par l'encodeur pour l'index et le packing ; None sinon.
+    if isinstance(values, np.ndarray) and values.ndim == 1 and values.size:
+        t = _detect_ndarray_type(values)
+        if t is not None:
+            return t, values
+
+    # Un seul passage (en C) pour collecter les types Python présents
+    kinds = set(map(_base_kind, set(map(type, values))))
+
     # nullable<T>
-    nullable = any(v is None for v in values)
-    clean = [v for v in values if v is not None]
+    nullable = type(None) in kinds
+    if nullable:
+        kinds.discard(type(None))
+        clean = [v for v in values if v is not None]
+    else:
+        clean = values
 
-    if not clean:
-        return "nullable<unknown>"
+    if not kinds:
+        return "nullable<unknown>", None
 
-    first = clean[0]
+    arr = None
 
     # bool
-    if all(isinstance(v, bool) for v in clean):
+    if kinds == {bool}:
         t = "bool"
 
     # int / uint
-    elif all(isinstance(v, int) and not isinstance(v, bool) for v in clean):
+    elif kinds == {int}:
         t = detect_numeric_type_int(clean)
+        if not nullable:
+            try:
+                arr = np.fromiter(clean, dtype=t, count=len(clean))
+            except OverflowError:
+                # Hors de la plage int64/uint64 : l'erreur sera levée au packing
+                arr = None
 
     # float
-    elif all(isinstance(v, float) for v in clean):
-        t = detect_numeric_type_float(clean)
+    elif kinds == {float}:
+        a = np.asarray(clean, dtype=np.float64)
+        t = _float_type_for_array(a)
+        if not nullable:
+            arr = a
+
+    # entiers mélangés aux flottants : promus en float64 s'ils y restent
+    # exactement représentables (pas de réduction en float16/float32, qui
+    # tronquerait les entiers au-delà de 2**11 / 2**24)
+    elif kinds == {int, float}:
+        if all(-2**53 <= v <= 2**53 for v in clean if not isinstance(v, float)):
+            t = "float64"
+            if not nullable:
+                arr = np.asarray(clean, dtype=np.float64)
+        else:
+            t = "json"
 
     # binary
-    elif all(isinstance(v, (bytes, bytearray)) for v in clean):
+    elif kinds <= {bytes, bytearray}:
         t = "binary"
 
     # string & dérivés
-    elif all(isinstance(v, str) for v in clean):
+    elif kinds == {str}:
         unique = set(clean)
 
         if all(is_uuid(v) for v in unique):
@@ -121,4 +185,4 @@ def detect_type(values):
     else:
         t = "json"
 
-    return f"nullable<{t}>" if nullable else t
\ No newline at end of file
+    return (f"nullable<{t}>" if nullable else t), arr
\ No newline at end of file
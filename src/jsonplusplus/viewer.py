@@ -469,11 +469,13 @@ class JONXViewer(ctk.CTk):
                     result = self.jonx_file.get_columns(self.jonx_file.fields)
                     
                     # Reconstruire les données ligne par ligne
-                    num_rows = len(result[self.jonx_file.fields[0]]) if self.jonx_file.fields else 0
-                    data = []
-                    for i in range(num_rows):
-                        row = {field: result[field][i] for field in self.jonx_file.fields}
-                        data.append(row)
+                    # (les colonnes numpy sont converties en valeurs Python)
+                    fields = self.jonx_file.fields
+                    col_lists = [
+                        result[field].tolist() if hasattr(result[field], "tolist") else result[field]
+                        for field in fields
+                    ]
+                    data = [dict(zip(fields, row)) for row in zip(*col_lists)]
                     
                     # Mettre à jour l'UI dans le thread principal
                     self.after(0, lambda: self.on_file_loaded(info, data))
@@ -610,7 +612,7 @@ class JONXViewer(ctk.CTk):
             if self.jonx_file.is_numeric(field):
                 try:
                     col = self.jonx_file.get_column(field)
-                    if col:
+                    if len(col) > 0:
                         min_val = self.jonx_file.find_min(field, use_index=True)
                         max_val = self.jonx_file.find_max(field, use_index=True)
                         avg_val = self.jonx_file.avg(field)
@@ -715,7 +717,8 @@ class JONXViewer(ctk.CTk):
         if file_path:
             try:
                 with open(file_path, 'w', encoding='utf-8') as f:
-                    json.dump(self.filtered_data, f, indent=2, ensure_ascii=False)
+                    # default=str : dates et UUID décodés en objets Python
+                    json.dump(self.filtered_data, f, indent=2, ensure_ascii=False, default=str)
                 
                 messagebox.showinfo("Succès", f"Données exportées vers {file_path}")
             except Exception as e:
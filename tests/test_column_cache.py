@@ -0,0 +1,40 @@
+import os
+import tempfile
+import unittest
+
+from jsonplusplus import JONXFile, encode_to_bytes
+
+
+class ColumnCacheIsolationTest(unittest.TestCase):
+    """Le cache de get_column ne doit pas être modifiable par un appelant."""
+
+    def setUp(self):
+        fd, self.path = tempfile.mkstemp(suffix=".jonx")
+        os.close(fd)
+        data = [{"id": i, "name": f"n{i}", "flag": i % 2 == 0} for i in range(50)]
+        with open(self.path, "wb") as f:
+            f.write(encode_to_bytes(data))
+        self.jonx = JONXFile(self.path)
+
+    def tearDown(self):
+        self.jonx.close()
+        os.remove(self.path)
+
+    def test_list_column_is_immutable(self):
+        names = self.jonx.get_column("name")
+        self.assertIsInstance(names, tuple)
+        with self.assertRaises(TypeError):
+            names[0] = "changed"
+        self.assertIs(self.jonx.get_column("name"), names)
+        self.assertEqual(names[0], "n0")
+
+    def test_array_column_is_read_only(self):
+        for field in ("id", "flag"):
+            column = self.jonx.get_column(field)
+            with self.assertRaises(ValueError):
+                column[0] = column[1]
+        self.assertEqual(self.jonx.find_min("id"), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
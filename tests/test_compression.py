@@ -0,0 +1,37 @@
+import os
+import threading
+import unittest
+
+from jsonplusplus.utils import compression
+from jsonplusplus.utils.compression import (
+    MULTITHREAD_MIN_BYTES, compress_many, decompress_many
+)
+
+
+class CompressManyTest(unittest.TestCase):
+    """Grosses trames : contexte multithread dans le thread appelant."""
+
+    def test_large_frames_use_multithread_context(self):
+        # Compression dans un thread neuf : son contexte thread-local est vierge
+        blobs = [
+            b"ab" * (MULTITHREAD_MIN_BYTES // 2),
+            os.urandom(1 << 19),
+            os.urandom(1 << 19),
+            b"tiny",
+        ]
+        result = {}
+
+        def run():
+            result["frames"] = compress_many(blobs)
+            result["mt"] = getattr(compression._local, "cctx_mt", None) is not None
+
+        thread = threading.Thread(target=run)
+        thread.start()
+        thread.join()
+
+        self.assertTrue(result["mt"])
+        self.assertEqual(decompress_many(result["frames"]), blobs)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,35 @@
+import os
+import tempfile
+import unittest
+
+from jsonplusplus import JONXDecodeError, JONXFile, encode_to_bytes
+
+
+@unittest.skipUnless(os.path.exists("/proc/self/maps"), "nécessite /proc (Linux)")
+class CorruptFileOpenTest(unittest.TestCase):
+    """Un fichier illisible ne doit laisser ni projection mémoire ni descripteur ouverts."""
+
+    def setUp(self):
+        data = bytearray(encode_to_bytes([{"a": i} for i in range(10)]))
+        data[12:20] = b"\xff" * 8  # taille et début du schéma corrompus
+        fd, self.path = tempfile.mkstemp(suffix=".jonx")
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+
+    def tearDown(self):
+        os.remove(self.path)
+
+    def test_failed_open_releases_mapping(self):
+        # Vérifié pendant que l'exception (et sa trace, qui référence
+        # l'instance) est encore vivante : rien ne doit dépendre du GC
+        try:
+            JONXFile(self.path)
+        except JONXDecodeError as e:
+            self.assertEqual(e.details.get("file_path"), self.path)
+            with open("/proc/self/maps") as f:
+                self.assertNotIn(self.path, f.read())
+        else:
+            self.fail("JONXDecodeError attendue")
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,30 @@
+import unittest
+
+from jsonplusplus import decode_from_bytes, encode_to_bytes
+
+
+def _roundtrip(values):
+    data = [{"c": v} for v in values]
+    result = decode_from_bytes(encode_to_bytes(data))
+    return result["types"]["c"], [row["c"] for row in result["json_data"]]
+
+
+class NullableDictionaryRoundtripTest(unittest.TestCase):
+    """Colonnes enum / string_dict nullables : None en tête, au milieu et en fin."""
+
+    def test_nullable_enum(self):
+        values = [None, "x", "y", None, "x", "y", None]
+        col_type, decoded = _roundtrip(values)
+        self.assertEqual(col_type, "nullable<enum>")
+        self.assertEqual(decoded, values)
+
+    def test_nullable_string_dict(self):
+        values = [f"w{i % 300}" for i in range(1200)]
+        values[0] = values[600] = values[-1] = None
+        col_type, decoded = _roundtrip(values)
+        self.assertEqual(col_type, "nullable<string_dict>")
+        self.assertEqual(decoded, values)
+
+
+if __name__ == "__main__":
+    unittest.main()
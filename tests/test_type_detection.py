@@ -0,0 +1,56 @@
+import enum
+import unittest
+
+import numpy as np
+
+from jsonplusplus import decode_from_bytes, encode_to_bytes
+from jsonplusplus.utils.type_detection import detect_type
+
+
+class _Level(enum.IntEnum):
+    LOW = 1
+    HIGH = 2
+
+
+class _Tag(str):
+    pass
+
+
+class SubclassDetectionTest(unittest.TestCase):
+    """Les sous-classes de bool/int/float/str suivent la table de leur type de base."""
+
+    def test_numpy_float(self):
+        self.assertEqual(detect_type([np.float64(1.5), 2.5]), "float16")
+
+    def test_int_enum(self):
+        self.assertEqual(detect_type([_Level.LOW, _Level.HIGH, 3]), "uint8")
+
+    def test_str_subclass(self):
+        self.assertEqual(detect_type([_Tag("a"), "b", None]), "nullable<enum>")
+
+    def test_bool_before_int(self):
+        self.assertEqual(detect_type([True, False]), "bool")
+        self.assertEqual(detect_type([True, 1]), "json")
+
+    def test_mixed_int_float_stays_float64(self):
+        values = [16777217, 0.5, -(2**53), None]
+        self.assertEqual(detect_type(values), "nullable<float64>")
+        data = [{"a": v} for v in values]
+        result = decode_from_bytes(encode_to_bytes(data))
+        self.assertEqual([row["a"] for row in result["json_data"]], values)
+        self.assertEqual(result["json_data"][0]["a"], 16777217.0)
+
+    def test_roundtrip(self):
+        data = [
+            {"f": np.float64(1.5), "l": _Level.LOW, "t": _Tag("x")},
+            {"f": 2.5, "l": _Level.HIGH, "t": "y"},
+        ]
+        result = decode_from_bytes(encode_to_bytes(data))
+        self.assertEqual(result["json_data"], [
+            {"f": 1.5, "l": 1, "t": "x"},
+            {"f": 2.5, "l": 2, "t": "y"},
+        ])
+
+
+if __name__ == "__main__":
+    unittest.main()